@@ -246,8 +246,9 @@ class ExcelPositionQueryApp:
             import logging
             
             # 清除现有的日志配置
-            for handler in logging.root.handlers[:]:
-                logging.root.removeHandler(handler)
+            for handler in tuple(logging.root.handlers):
+                handler.close()
+            logging.root.handlers.clear()
             
             # 重新配置日志
             logging.basicConfig(
@@ -1,4 +1,4 @@
 # Models module for data structures
-from .data_models import Position, InterviewCandidate, PositionScoreResult
+from .data_models import Position, InterviewCandidate, PositionScoreResult, PositionStatus
 
-__all__ = ['Position', 'InterviewCandidate', 'PositionScoreResult']
\ No newline at end of file
+__all__ = ['Position', 'InterviewCandidate', 'PositionScoreResult', 'PositionStatus']
\ No newline at end of file
@@ -2,8 +2,11 @@
 数据模型定义
 定义了系统中使用的核心数据结构
 """
+import sys
+import logging
 from dataclasses import dataclass
-from typing import Optional, List
+from enum import IntEnum
+from typing import Optional, List, Union
 
 
 @dataclass
@@ -39,7 +42,40 @@ class InterviewCandidate:
             raise ValueError(f"分数不能为负数: {self.score}")
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# Python 3.10+ 支持dataclass生成__slots__，低版本保持普通dataclass
+_SLOTS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class PositionStatus(IntEnum):
+    """岗位处理状态"""
+    NORMAL = 0  # 正常
+    NO_INTERVIEW = 1  # 无面试人员
+    UNMATCHED = 2  # 无法匹配
+    DATA_ERROR = 3  # 数据异常
+    
+    @property
+    def label(self) -> str:
+        """报告中显示的状态文本"""
+        return STATUS_LABELS[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'PositionStatus':
+        """根据状态文本获取状态"""
+        try:
+            return _LABEL_TO_STATUS[label.strip()]
+        except KeyError:
+            raise ValueError(f"未知的岗位状态: {label}")
+
+
+# 按状态值索引的状态文本
+STATUS_LABELS = ("正常", "无面试人员", "无法匹配", "数据异常")
+_LABEL_TO_STATUS = {label: PositionStatus(value) for value, label in enumerate(STATUS_LABELS)}
+
+
+@dataclass(**_SLOTS_KWARGS)
 class PositionScoreResult:
     """岗位分数结果数据模型"""
     position_code: str
@@ -49,9 +85,10 @@ class PositionScoreResult:
     recruit_count: int  # 招考人数
     candidate_count: int  # 面试人数
     min_score: Optional[float]
-    status: str  # "正常", "无面试人员", "数据异常"
+    status: Union[PositionStatus, str]  # 岗位状态，也可传入状态文本如 "正常"，未知文本按数据异常处理
     notes: str
     all_scores: Optional[List[float]] = None  # 存储所有面试分数
+    scores_text: str = ""  # 格式化的分数文本，如 "90.0, 85.5"，未提供时根据all_scores生成
     
     def __post_init__(self):
         """数据后处理，清理空白字符"""
@@ -67,5 +104,21 @@ class PositionScoreResult:
         self.position_name = self.position_name.strip() if self.position_name else ""
         self.department = self.department.strip() if self.department else ""
         self.department_name = self.department_name.strip() if self.department_name else ""
-        self.status = self.status.strip() if self.status else ""
-        self.notes = self.notes.strip() if self.notes else ""
\ No newline at end of file
+        if isinstance(self.status, str):
+            try:
+                self.status = PositionStatus.from_label(self.status)
+            except ValueError:
+                # 兼容此前接受任意状态文本的行为，未知文本记录警告后按数据异常处理
+                logger.warning(f"岗位 {self.position_code} 的状态文本未知: {self.status!r}，按数据异常处理")
+                self.status = PositionStatus.DATA_ERROR
+        else:
+            self.status = PositionStatus(self.status)
+        self.notes = self.notes.strip() if self.notes else ""
+        
+        # 分数文本只在此处格式化一次，报告和备注共用
+        if self.all_scores and not self.scores_text:
+            self.scores_text = ', '.join(map(str, self.all_scores))
+        
+        # 正常岗位未提供备注时，使用分数汇总作为备注
+        if not self.notes and self.status == PositionStatus.NORMAL and self.all_scores:
+            self.notes = f"共{len(self.all_scores)}人，分数: [{self.scores_text}]"
\ No newline at end of file
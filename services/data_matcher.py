@@ -3,6 +3,7 @@
 提供岗位数据匹配和验证功能
 """
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Set
 from difflib import SequenceMatcher
 import re
@@ -85,6 +86,9 @@ class DataMatcher:
             # 获取面试名单中的唯一岗位
             interview_positions = self._extract_interview_positions(interview_data)
             
+            # 一次性统计各面试岗位的人数，避免每个匹配岗位都扫描全部面试数据
+            candidate_counts = Counter(interview.get('position_name') for interview in interview_data)
+            
             # 为每个职位表中的岗位寻找匹配
             for position in position_data:
                 match_result = self._find_best_match(position, interview_positions, interview_data)
@@ -98,7 +102,7 @@ class DataMatcher:
                         sheet_name=position.get('sheet_name', ''),
                         interview_position=match_result.interview_position,
                         match_confidence=match_result.confidence,
-                        candidate_count=self._count_candidates(match_result.interview_position, interview_data)
+                        candidate_count=candidate_counts[match_result.interview_position]
                     )
                     self._position_mappings.append(mapping)
                     
@@ -376,23 +380,6 @@ class DataMatcher:
         # 如果有交集，说明包含相同关键词
         return len(keywords1.intersection(keywords2)) > 0
     
-    def _count_candidates(self, interview_position: str, interview_data: List[Dict]) -> int:
-        """
-        统计指定岗位的面试人员数量
-        
-        Args:
-            interview_position: 面试岗位名称
-            interview_data: 面试人员数据列表
-            
-        Returns:
-            int: 面试人员数量
-        """
-        count = 0
-        for interview in interview_data:
-            if interview.get('position_name') == interview_position:
-                count += 1
-        return count
-    
     def _generate_match_result(self) -> Dict:
         """
         生成匹配结果统计
@@ -8,6 +8,13 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 
+try:
+    import python_calamine  # noqa: F401
+    # 安装了python-calamine且pandas支持（2.2及以上）时使用calamine解析，比openpyxl快数倍
+    _READ_ENGINE = 'calamine' if tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2) else None
+except ImportError:
+    _READ_ENGINE = None  # 使用pandas默认引擎
+
 
 class ExcelProcessingError(Exception):
     """Excel文件处理相关异常"""
@@ -71,40 +78,8 @@ class ExcelReader:
             标题行的索引位置（0-based）
         """
         try:
-            import openpyxl
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            
-            if sheet_name and sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-            else:
-                ws = wb.active
-            
             # 读取前5行数据来检测标题行
-            rows_data = []
-            max_cols = 0
-            
-            # 先确定最大列数
-            for row in ws.iter_rows(min_row=1, max_row=5):
-                max_cols = max(max_cols, len(row))
-            
-            for row_num in range(1, 6):  # 读取前5行
-                row_data = []
-                
-                # 确保读取所有列
-                for col_num in range(1, max_cols + 1):
-                    try:
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell_value = cell.value
-                        if cell_value is not None:
-                            row_data.append(str(cell_value).strip())
-                        else:
-                            row_data.append('')
-                    except:
-                        row_data.append('')
-                
-                rows_data.append(row_data)
-            
-            wb.close()
+            rows_data = self._read_leading_rows(file_path, sheet_name)
             
             # 分析每一行，找到最可能是标题行的行
             best_header_row_index = 0
@@ -127,6 +102,40 @@ class ExcelReader:
             self.logger.warning(f"智能检测标题行位置失败: {e}，使用默认位置0")
             return 0
 
+    def _read_leading_rows(self, file_path: str, sheet_name: Optional[str] = None,
+                           max_rows: int = 5) -> List[List[str]]:
+        """
+        读取工作表开头若干行的单元格文本，用于检测标题行
+        
+        以只读、仅取值模式打开工作簿并按行流式读取，不构建完整的工作簿对象，
+        公式单元格取其缓存的计算结果
+        
+        Args:
+            file_path: Excel文件路径
+            sheet_name: 工作表名称，不存在时使用活动工作表
+            max_rows: 读取的最大行数
+            
+        Returns:
+            各行的单元格文本列表，按最大列数补齐，空单元格为空字符串
+        """
+        import openpyxl
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if sheet_name and sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+            else:
+                ws = wb.active
+            rows = list(ws.iter_rows(min_row=1, max_row=max_rows, values_only=True))
+        finally:
+            wb.close()
+        
+        max_cols = max((len(row) for row in rows), default=0)
+        return [
+            [str(value).strip() if value is not None else '' for value in row]
+            + [''] * (max_cols - len(row))
+            for row in rows
+        ]
+
     def _detect_header_row(self, file_path: str, sheet_name: Optional[str] = None) -> List[str]:
         """
         智能检测Excel文件的标题行位置
@@ -141,9 +150,9 @@ class ExcelReader:
         # 首先尝试使用pandas直接读取（处理合并单元格等复杂情况）
         try:
             if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=0)
+                df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=0, engine=_READ_ENGINE)
             else:
-                df = pd.read_excel(file_path, nrows=0)
+                df = pd.read_excel(file_path, nrows=0, engine=_READ_ENGINE)
             
             columns = [str(col).strip() for col in df.columns 
                       if str(col).strip() and str(col) != 'nan' 
@@ -158,40 +167,8 @@ class ExcelReader:
         
         # 如果pandas失败，使用openpyxl进行智能检测
         try:
-            import openpyxl
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            
-            if sheet_name and sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-            else:
-                ws = wb.active
-            
             # 读取前5行数据来检测标题行
-            rows_data = []
-            max_cols = 0
-            
-            # 先确定最大列数
-            for row in ws.iter_rows(min_row=1, max_row=5):
-                max_cols = max(max_cols, len(row))
-            
-            for row_num in range(1, 6):  # 读取前5行
-                row_data = []
-                
-                # 确保读取所有列
-                for col_num in range(1, max_cols + 1):
-                    try:
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell_value = cell.value
-                        if cell_value is not None:
-                            row_data.append(str(cell_value).strip())
-                        else:
-                            row_data.append('')
-                    except:
-                        row_data.append('')
-                
-                rows_data.append(row_data)
-            
-            wb.close()
+            rows_data = self._read_leading_rows(file_path, sheet_name)
             
             # 分析每一行，找到最可能是标题行的行
             best_header_row = None
@@ -330,9 +307,9 @@ class ExcelReader:
                 try:
                     if sheet_name:
                         df = pd.read_excel(file_path, sheet_name=sheet_name, 
-                                         skiprows=skip_rows, nrows=1)
+                                         skiprows=skip_rows, nrows=1, engine=_READ_ENGINE)
                     else:
-                        df = pd.read_excel(file_path, skiprows=skip_rows, nrows=1)
+                        df = pd.read_excel(file_path, skiprows=skip_rows, nrows=1, engine=_READ_ENGINE)
                     
                     columns = [str(col).strip() for col in df.columns 
                              if str(col).strip() and str(col) != 'nan' 
@@ -401,7 +378,7 @@ class ExcelReader:
         """
         try:
             # 尝试读取Excel文件的基本信息
-            excel_file = pd.ExcelFile(file_path)
+            excel_file = pd.ExcelFile(file_path, engine=_READ_ENGINE)
             
             # 检查是否有sheet
             if not excel_file.sheet_names:
@@ -410,7 +387,7 @@ class ExcelReader:
             # 检查每个sheet是否可以读取
             for sheet_name in excel_file.sheet_names:
                 try:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=1)
+                    df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=1, engine=_READ_ENGINE)
                     if df.empty:
                         self.logger.warning(f"工作表 '{sheet_name}' 为空")
                 except Exception as e:
@@ -442,7 +419,7 @@ class ExcelReader:
         self.validate_file_path(file_path)
         
         try:
-            excel_file = pd.ExcelFile(file_path)
+            excel_file = pd.ExcelFile(file_path, engine=_READ_ENGINE)
             sheet_names = excel_file.sheet_names
             excel_file.close()
             
@@ -452,13 +429,15 @@ class ExcelReader:
         except Exception as e:
             raise ExcelProcessingError(f"获取工作表名称失败: {str(e)}")
             
-    def read_excel_sheet(self, file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def read_excel_sheet(self, file_path: str, sheet_name: Optional[str] = None,
+                         nrows: Optional[int] = None) -> pd.DataFrame:
         """
         读取Excel文件的指定工作表
         
         Args:
             file_path: Excel文件路径
             sheet_name: 工作表名称，如果为None则读取第一个工作表
+            nrows: 最多读取的数据行数，如果为None则读取全部数据
             
         Returns:
             pd.DataFrame: 读取的数据
@@ -487,9 +466,9 @@ class ExcelReader:
             # 预读取列名以确定数据类型
             try:
                 if header_row_index > 0:
-                    temp_df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=header_row_index, nrows=0)
+                    temp_df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=header_row_index, nrows=0, engine=_READ_ENGINE)
                 else:
-                    temp_df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=0)
+                    temp_df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=0, engine=_READ_ENGINE)
                 
                 # 为包含"代码"的列设置文本类型
                 for col in temp_df.columns:
@@ -503,9 +482,11 @@ class ExcelReader:
             
             # 读取数据，使用检测到的标题行和数据类型
             if header_row_index > 0:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=header_row_index, dtype=dtype_dict)
+                df = pd.read_excel(file_path, sheet_name=sheet_name, skiprows=header_row_index, dtype=dtype_dict,
+                                   nrows=nrows, engine=_READ_ENGINE)
             else:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=dtype_dict)
+                df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=dtype_dict,
+                                   nrows=nrows, engine=_READ_ENGINE)
             
             # 基本数据清理
             df = df.dropna(how='all')  # 删除完全为空的行
@@ -807,18 +788,24 @@ class ExcelReader:
         positions = []
         
         for sheet_name, df in position_sheets.items():
-            for _, row in df.iterrows():
-                position_info = {
-                    'sheet_name': sheet_name,
-                    'position_name': row.get('position_name', ''),
-                    'position_code': row.get('position_code', ''),
-                    'department': row.get('department', sheet_name),
-                    'row_index': row.name
-                }
-                
-                # 确保职位名称不为空
-                if position_info['position_name']:
-                    positions.append(position_info)
+            if df.empty:
+                continue
+            
+            # 按列整体构建职位信息，避免逐行iterrows
+            columns = df.columns
+            position_frame = pd.DataFrame({
+                'sheet_name': sheet_name,
+                'position_name': df['position_name'] if 'position_name' in columns else '',
+                'position_code': df['position_code'] if 'position_code' in columns else '',
+                'department': df['department'] if 'department' in columns else sheet_name,
+                'row_index': df.index
+            }, index=df.index)
+            
+            # 确保职位名称不为空
+            positions.extend(
+                position_info for position_info in position_frame.to_dict('records')
+                if position_info['position_name']
+            )
                     
         self.logger.info(f"提取职位信息完成，共 {len(positions)} 个职位")
         return positions
@@ -1077,20 +1064,25 @@ class ExcelReader:
         Returns:
             List[Dict]: 面试人员信息列表
         """
-        interviews = []
+        if interview_df.empty:
+            self.logger.info("提取面试信息完成，共 0 个面试人员")
+            return []
         
-        for _, row in interview_df.iterrows():
-            interview_info = {
-                'name': row.get('name', ''),
-                'position_name': row.get('position_name', ''),
-                'score': row.get('score', 0.0),
-                'is_qualified': row.get('is_qualified', False),
-                'row_index': row.name
-            }
-            
-            # 确保必要字段不为空
-            if interview_info['name'] and interview_info['position_name']:
-                interviews.append(interview_info)
+        # 按列整体构建面试信息，避免逐行iterrows
+        columns = interview_df.columns
+        interview_frame = pd.DataFrame({
+            'name': interview_df['name'] if 'name' in columns else '',
+            'position_name': interview_df['position_name'] if 'position_name' in columns else '',
+            'score': interview_df['score'] if 'score' in columns else 0.0,
+            'is_qualified': interview_df['is_qualified'] if 'is_qualified' in columns else False,
+            'row_index': interview_df.index
+        }, index=interview_df.index)
+        
+        # 确保必要字段不为空
+        interviews = [
+            interview_info for interview_info in interview_frame.to_dict('records')
+            if interview_info['name'] and interview_info['position_name']
+        ]
                 
         self.logger.info(f"提取面试信息完成，共 {len(interviews)} 个面试人员")
         return interviews
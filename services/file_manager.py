@@ -9,6 +9,18 @@ import shutil
 from datetime import datetime
 
 
+# Windows文件名无效字符，转换表用于一次性删除这些字符
+_INVALID_CHARS = '<>:"/\\|?*'
+_INVALID_CHARS_TABLE = str.maketrans('', '', _INVALID_CHARS)
+
+# Windows保留文件名
+_RESERVED_NAMES = frozenset(
+    ['CON', 'PRN', 'AUX', 'NUL']
+    + [f'COM{i}' for i in range(1, 10)]
+    + [f'LPT{i}' for i in range(1, 10)]
+)
+
+
 class FileManager:
     """文件管理器类"""
     
@@ -51,7 +63,8 @@ class FileManager:
         if path.suffix.lower() != '.xlsx':
             path = path.with_suffix('.xlsx')
         
-        return str(path.resolve())
+        # abspath 只做字符串规范化，不像 resolve 那样逐级解析符号链接
+        return os.path.abspath(path)
     
     def handle_file_conflict(self, file_path: str, strategy: str = "auto_rename") -> str:
         """
@@ -88,22 +101,31 @@ class FileManager:
         base_name = path.stem
         extension = path.suffix
         directory = path.parent
+        max_counter = 1000  # 防止无限探测
         
-        counter = 1
-        while True:
-            new_name = f"{base_name}_{counter}{extension}"
-            new_path = directory / new_name
-            
-            if not new_path.exists():
-                return str(new_path)
-            
-            counter += 1
-            
-            # 防止无限循环
-            if counter > 1000:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                new_name = f"{base_name}_{timestamp}{extension}"
-                return str(directory / new_name)
+        def candidate(counter: int) -> Path:
+            return directory / f"{base_name}_{counter}{extension}"
+        
+        # 倍增探测找到第一个不存在的序号上界，再二分查找相邻的空位，
+        # 冲突文件较多时存在性检查次数由 O(N) 降为 O(log N)；
+        # 序号不连续时返回的未必是最小空位，但一定是不存在的文件名
+        occupied, free = 0, 1
+        while free <= max_counter and candidate(free).exists():
+            occupied, free = free, min(free * 2, max_counter + 1)
+        
+        while free - occupied > 1:
+            middle = (occupied + free) // 2
+            if candidate(middle).exists():
+                occupied = middle
+            else:
+                free = middle
+        
+        if free > max_counter:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            new_name = f"{base_name}_{timestamp}{extension}"
+            return str(directory / new_name)
+        
+        return str(candidate(free))
     
     def _create_backup_and_return_original(self, file_path: str) -> str:
         """
@@ -177,26 +199,16 @@ class FileManager:
         Returns:
             bool: 是否有效
         """
-        # Windows无效字符
-        invalid_chars = '<>:"/\\|?*'
-        
         if not filename or filename.strip() == "":
             return False
         
-        # 检查无效字符
-        for char in invalid_chars:
-            if char in filename:
-                return False
+        # 检查无效字符：删除无效字符后长度不变即不含无效字符
+        if len(filename.translate(_INVALID_CHARS_TABLE)) != len(filename):
+            return False
         
         # 检查保留名称（Windows）
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-        
-        name_without_ext = Path(filename).stem.upper()
-        if name_without_ext in reserved_names:
+        name_without_ext = os.path.splitext(filename)[0].upper()
+        if name_without_ext in _RESERVED_NAMES:
             return False
         
         return True
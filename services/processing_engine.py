@@ -2,18 +2,71 @@
 业务逻辑引擎
 整合文件读取、数据匹配、分数计算和报告生成的主要业务流程控制器
 """
+import functools
 import logging
 import os
+import re
+import time
+from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Callable, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
+import pandas as pd
+import numpy as np
 
-from models.data_models import Position, InterviewCandidate, PositionScoreResult
+from models.data_models import Position, InterviewCandidate, PositionScoreResult, PositionStatus
 from services.excel_reader import ExcelReader, ExcelProcessingError
-from services.data_matcher import DataMatcher, DataMatchingError
+from services.data_matcher import DataMatcher, DataMatchingError, PositionMapping
+from services.configurable_data_matcher import ConfigurableDataMatcher
 from services.data_validator import DataValidator, ValidationError
 from services.report_generator import ReportGenerator
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # 可选依赖，仅在显式启用rapidfuzz相似度计算时需要
+    Indel = None
+
+
+# 文本标准化使用的预编译正则与空值标记
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\u4e00-\u9fff\s\-\(\)（）]')
+_NULL_TOKENS = frozenset({'nan', 'null', 'none', ''})
+
+# 验证输入文件结构时每个工作表最多读取的数据行数，完整数据在后续步骤中读取
+_VALIDATION_SAMPLE_ROWS = 1000
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_text(text_str: str) -> str:
+    """
+    清理文本中的空白和特殊字符
+    
+    同一张表中职位名称、部门等取值大量重复，按字符串缓存结果，
+    重复出现的值只做一次正则处理
+    
+    Args:
+        text_str: 已转换为字符串的原始文本
+        
+    Returns:
+        str: 标准化后的文本
+    """
+    text_str = text_str.strip()
+    
+    # 快速路径：只含字母、数字和汉字的文本（与正则中的 \w 一致）
+    # 不含空白和特殊字符，两次替换都不会改变内容，可直接跳过
+    if not text_str.isalnum():
+        # 移除多余的空白字符
+        text_str = _WS_RE.sub(' ', text_str)
+        
+        # 移除特殊字符（保留中文、英文、数字和常用标点）
+        text_str = _PUNCT_RE.sub('', text_str)
+    
+    # 处理常见的编码问题
+    if text_str.lower() in _NULL_TOKENS:
+        return ""
+    
+    return text_str.strip()
+
 
 class ProcessingEngineError(Exception):
     """业务处理引擎相关异常"""
@@ -47,15 +100,28 @@ class ProcessingResult:
 class ProcessingEngine:
     """业务逻辑处理引擎"""
     
-    def __init__(self, progress_callback: Optional[Callable[[ProcessingProgress], None]] = None):
+    # 进度回调最小间隔（秒），避免界面频繁重绘
+    PROGRESS_THROTTLE_INTERVAL = 0.016
+    
+    def __init__(self, progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+                 use_rapidfuzz: bool = False):
         """
         初始化处理引擎
         
         Args:
             progress_callback: 进度回调函数，用于更新处理进度
+            use_rapidfuzz: 是否使用rapidfuzz的C实现计算岗位名称相似度（需安装rapidfuzz），
+                默认使用difflib的SequenceMatcher
+                
+        Raises:
+            ValueError: 启用rapidfuzz但未安装
         """
+        if use_rapidfuzz and Indel is None:
+            raise ValueError("使用rapidfuzz计算相似度需要先安装rapidfuzz")
+        
         self.logger = logging.getLogger(__name__)
         self.progress_callback = progress_callback
+        self.use_rapidfuzz = use_rapidfuzz
         
         # 初始化各个组件
         self.excel_reader = ExcelReader()
@@ -69,6 +135,10 @@ class ProcessingEngine:
         self._start_time = None
         self._processing_errors = []
         self._processing_warnings = []
+        # 进度回调节流状态：上次回调的时间和步骤，以及被节流暂存的最新进度
+        self._last_progress_ts = 0.0
+        self._last_progress_step = None
+        self._pending_progress = None
         
         self.logger.info("ProcessingEngine 初始化完成")
     
@@ -93,6 +163,11 @@ class ProcessingEngine:
         self._start_time = datetime.now()
         self._processing_errors.clear()
         self._processing_warnings.clear()
+        # 新一轮处理的第一步始终回调，不受上一轮最后一次回调时间的影响
+        self._last_progress_step = None
+        self._pending_progress = None
+        # 每次处理前清空文本标准化缓存，缓存只保留本次输入文件中的取值
+        _normalize_text.cache_clear()
         
         try:
             self.logger.info(f"开始处理文件 - 职位表: {position_file}, 面试名单: {interview_file}")
@@ -172,6 +247,11 @@ class ProcessingEngine:
                 errors=self._processing_errors + [str(e)],
                 warnings=self._processing_warnings.copy()
             )
+        finally:
+            # 补发被节流暂存的最后一条进度
+            self._flush_progress()
+            # 处理结束后释放缓存的取值，不在两次处理之间保留整份名单
+            _normalize_text.cache_clear()
     
     def validate_input_files(self, position_file: str, interview_file: str) -> bool:
         """
@@ -297,7 +377,8 @@ class ProcessingEngine:
                 valid_sheets = 0
                 for sheet_name in sheet_names:
                     try:
-                        df = self.excel_reader.read_excel_sheet(position_file, sheet_name)
+                        df = self.excel_reader.read_excel_sheet(position_file, sheet_name,
+                                                                nrows=_VALIDATION_SAMPLE_ROWS)
                         if not df.empty:
                             # 简单检查是否包含职位相关列
                             columns_str = ' '.join([str(col).lower() for col in df.columns])
@@ -343,9 +424,9 @@ class ProcessingEngine:
             self.excel_reader.validate_file_path(interview_file)
             self.excel_reader.check_excel_format(interview_file)
             
-            # 预读取验证数据结构
+            # 预读取验证数据结构，只抽查开头的数据行
             try:
-                df = self.excel_reader.read_excel_sheet(interview_file)
+                df = self.excel_reader.read_excel_sheet(interview_file, nrows=_VALIDATION_SAMPLE_ROWS)
                 if df.empty:
                     error_msg = "面试人员名单文件没有数据"
                     self._processing_errors.append(error_msg)
@@ -391,7 +472,8 @@ class ProcessingEngine:
                     self._processing_warnings.append(warning_msg)
                     self.logger.warning(warning_msg)
                 
-                self.logger.info(f"面试人员名单文件验证通过: {interview_file}，包含 {len(non_empty_rows)} 行有效数据")
+                self.logger.info(f"面试人员名单文件验证通过: {interview_file}，"
+                                 f"抽查的 {len(df)} 行中有 {len(non_empty_rows)} 行有效数据")
                 
             except Exception as e:
                 error_msg = f"面试人员名单文件数据结构验证失败: {str(e)}"
@@ -455,9 +537,9 @@ class ProcessingEngine:
                     # 精确匹配检查
                     exact_matches = position_names.intersection(interview_positions)
                     
-                    # 模糊匹配检查
+                    # 模糊匹配检查，只对未精确匹配的职位名称计算相似度
                     fuzzy_matches = 0
-                    for pos_name in position_names:
+                    for pos_name in position_names - exact_matches:
                         for int_name in interview_positions:
                             if self._calculate_similarity(pos_name, int_name) > 0.6:
                                 fuzzy_matches += 1
@@ -498,7 +580,8 @@ class ProcessingEngine:
             float: 相似度 (0-1)
         """
         try:
-            from difflib import SequenceMatcher
+            if self.use_rapidfuzz:
+                return Indel.normalized_similarity(str1.lower(), str2.lower())
             return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
         except Exception:
             return 0.0
@@ -628,9 +711,6 @@ class ProcessingEngine:
             # 执行岗位匹配
             if column_mappings:
                 # 使用可配置的数据匹配器
-                from .configurable_data_matcher import ConfigurableDataMatcher
-                import pandas as pd
-                
                 # 检查是否提供了文件路径
                 if not position_file or not interview_file:
                     raise ProcessingEngineError("使用可配置匹配器时需要提供文件路径")
@@ -686,8 +766,6 @@ class ProcessingEngine:
             转换后的匹配结果
         """
         try:
-            from .data_matcher import PositionMapping
-            
             match_results = configurable_results['match_results']
             statistics = configurable_results['statistics']
             
@@ -695,16 +773,22 @@ class ProcessingEngine:
             mappings = []
             unmatched_positions = []
             
+            # 岗位行均来自同一张表，键集合一致，循环前确定实际使用的列名
+            sample_row = next((result.position_row for result in match_results if result.position_row), {})
+            code_key = '职位代码' if '职位代码' in sample_row else '岗位代码'
+            name_key = '招考职位' if '招考职位' in sample_row else '岗位名称'
+            
             for result in match_results:
                 if result.matched:
                     # 创建PositionMapping对象
                     position_data = result.position_row
+                    recruit_count = position_data.get('招考人数')
                     mapping = PositionMapping(
-                        position_code=str(position_data.get('职位代码', position_data.get('岗位代码', ''))),
-                        position_name=position_data.get('招考职位', position_data.get('岗位名称', '')),
+                        position_code=str(position_data.get(code_key, '')),
+                        position_name=position_data.get(name_key, ''),
                         department=position_data.get('用人司局', ''),  # 用人司局
                         department_name=position_data.get('部门名称', ''),  # 部门名称
-                        recruit_count=int(position_data.get('招考人数', 0)) if position_data.get('招考人数') else 0,
+                        recruit_count=int(recruit_count) if recruit_count else 0,
                         sheet_name=position_data.get('sheet_name', ''),
                         interview_position=result.interview_rows[0].get('招考职位', '') if result.interview_rows else '',
                         match_confidence=result.match_score,
@@ -761,51 +845,26 @@ class ProcessingEngine:
             mappings = match_results.get('mappings', [])
             unmatched_positions = match_results.get('unmatched_positions', [])
             
-            # 处理所有岗位（包括匹配和未匹配的）
-            all_positions = []
+            # 一次性将面试分数整理为按岗位分组的数组，避免每个岗位重复扫描全部面试数据
+            scores_by_position = self._group_interview_scores(interview_data)
+            empty_scores = np.empty(0, dtype=float)
             
-            # 添加匹配成功的岗位
+            # 为每个岗位（无论是否匹配）生成结果，单个岗位出错不中断整个流程
+            # 处理匹配成功的岗位
             for mapping in mappings:
-                all_positions.append({
-                    'type': 'matched',
-                    'data': mapping
-                })
+                try:
+                    position_scores = scores_by_position.get(mapping.interview_position, empty_scores)
+                    results.append(self._process_matched_position(mapping, position_scores))
+                except Exception as e:
+                    self._record_position_error(getattr(mapping, 'position_name', '未知岗位'), e)
             
-            # 添加未匹配的岗位
+            # 处理未匹配的岗位
             for position in unmatched_positions:
-                all_positions.append({
-                    'type': 'unmatched',
-                    'data': position
-                })
-            
-            # 为每个岗位（无论是否匹配）生成结果
-            for position_info in all_positions:
                 try:
-                    if position_info['type'] == 'matched':
-                        # 处理匹配成功的岗位
-                        mapping = position_info['data']
-                        result = self._process_matched_position(mapping, interview_data)
-                    else:
-                        # 处理未匹配的岗位
-                        position = position_info['data']
-                        result = self._process_unmatched_position(position)
-                    
-                    results.append(result)
-                    
+                    results.append(self._process_unmatched_position(position))
                 except Exception as e:
-                    # 处理单个岗位计算错误，不中断整个流程
-                    position_name = "未知岗位"
-                    try:
-                        if position_info['type'] == 'matched':
-                            position_name = position_info['data'].position_name
-                        else:
-                            position_name = position_info['data'].get('招考职位', '未知岗位')
-                    except:
-                        pass
-                    
-                    error_msg = f"处理岗位 '{position_name}' 时发生错误: {str(e)}"
-                    self._processing_warnings.append(error_msg)
-                    self.logger.warning(error_msg)
+                    position_name = position.get('招考职位', '未知岗位') if isinstance(position, dict) else '未知岗位'
+                    self._record_position_error(position_name, e)
             
             self.logger.info(f"岗位分数处理完成，共处理 {len(results)} 个岗位")
             return results
@@ -813,24 +872,57 @@ class ProcessingEngine:
         except Exception as e:
             raise ProcessingEngineError(f"处理岗位分数时发生错误: {str(e)}")
     
-    def _process_matched_position(self, mapping, interview_data: List[Dict]) -> 'PositionScoreResult':
+    def _record_position_error(self, position_name: str, error: Exception):
+        """
+        记录单个岗位处理时发生的错误
+        
+        Args:
+            position_name: 岗位名称
+            error: 发生的异常
+        """
+        error_msg = f"处理岗位 '{position_name}' 时发生错误: {str(error)}"
+        self._processing_warnings.append(error_msg)
+        self.logger.warning(error_msg)
+    
+    def _group_interview_scores(self, interview_data: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        将面试人员分数按岗位名称分组
+        
+        Args:
+            interview_data: 面试人员数据列表
+            
+        Returns:
+            Dict[str, np.ndarray]: 岗位名称到分数数组的映射，分数按降序排列，无效分数为NaN并排在末尾
+        """
+        if not interview_data:
+            return {}
+        
+        interview_df = pd.DataFrame(interview_data, columns=['position_name', 'score'])
+        interview_df['score'] = pd.to_numeric(interview_df['score'], errors='coerce')
+        
+        # 整体按分数降序排序一次，分组后各岗位的分数数组无需再单独排序
+        interview_df = interview_df.sort_values('score', ascending=False, kind='stable', na_position='last')
+        scores = interview_df['score'].to_numpy(dtype=float)
+        
+        return {
+            position_name: scores[indices]
+            for position_name, indices in interview_df.groupby('position_name', sort=False).indices.items()
+        }
+    
+    def _process_matched_position(self, mapping, position_scores: np.ndarray) -> 'PositionScoreResult':
         """
         处理匹配成功的岗位
         
         Args:
             mapping: 岗位映射信息
-            interview_data: 面试人员数据列表
+            position_scores: 该岗位所有面试人员的分数数组（降序），无效分数为NaN
             
         Returns:
             PositionScoreResult: 岗位处理结果
         """
-        # 获取该岗位的所有面试人员
-        position_candidates = [
-            interview for interview in interview_data
-            if interview.get('position_name') == mapping.interview_position
-        ]
+        candidate_count = len(position_scores)
         
-        if not position_candidates:
+        if candidate_count == 0:
             # 没有面试人员的情况
             return PositionScoreResult(
                 position_code=mapping.position_code,
@@ -840,63 +932,44 @@ class ProcessingEngine:
                 recruit_count=mapping.recruit_count,
                 candidate_count=0,
                 min_score=None,
-                status="无面试人员",
+                status=PositionStatus.NO_INTERVIEW,
                 notes=f"该岗位在面试名单中没有找到面试人员",
                 all_scores=[]
             )
         
-        # 获取所有面试人员的分数
-        scores = []
-        candidate_details = []
+        # 过滤无效分数
+        valid_scores = position_scores[~np.isnan(position_scores)]
+        invalid_count = candidate_count - len(valid_scores)
+        if invalid_count:
+            self.logger.warning(f"岗位 '{mapping.position_name}' 跳过 {invalid_count} 个无效分数")
         
-        for candidate in position_candidates:
-            score = candidate.get('score')
-            name = candidate.get('name', '未知')
-            
-            # 安全地处理分数数据
-            if score is not None:
-                try:
-                    # 确保分数是数字类型
-                    if isinstance(score, (int, float)):
-                        score_value = float(score)
-                    else:
-                        # 如果是字符串，尝试转换
-                        score_str = str(score).strip() if hasattr(score, 'strip') else str(score)
-                        score_value = float(score_str)
-                    
-                    scores.append(score_value)
-                    candidate_details.append(f"{name}: {score_value}")
-                except (ValueError, TypeError, AttributeError) as e:
-                    self.logger.warning(f"跳过无效分数: {score} (类型: {type(score)}) - {e}")
-                    continue
-        
-        if not scores:
+        if len(valid_scores) == 0:
             return PositionScoreResult(
                 position_code=mapping.position_code,
                 position_name=mapping.position_name,
                 department=mapping.department,
                 department_name=mapping.department_name,
                 recruit_count=mapping.recruit_count,
-                candidate_count=len(position_candidates),
+                candidate_count=candidate_count,
                 min_score=None,
-                status="数据异常",
+                status=PositionStatus.DATA_ERROR,
                 notes="面试人员存在但没有有效分数数据",
                 all_scores=[]
             )
         else:
-            # 不计算最低分，而是列出所有分数
-            sorted_scores = sorted(scores, reverse=True)
-            scores_summary = f"共{len(scores)}人，分数: {sorted_scores}"
+            # 不计算最低分，而是列出所有分数（分组时已按降序排列）
+            sorted_scores = valid_scores.tolist()
+            # 分数文本和备注由PositionScoreResult根据all_scores统一生成
             return PositionScoreResult(
                 position_code=mapping.position_code,
                 position_name=mapping.position_name,
                 department=mapping.department,
                 department_name=mapping.department_name,
                 recruit_count=mapping.recruit_count,
-                candidate_count=len(scores),
+                candidate_count=len(sorted_scores),
                 min_score=None,  # 不设置最低分
-                status="正常",
-                notes=scores_summary,
+                status=PositionStatus.NORMAL,
+                notes="",
                 all_scores=sorted_scores  # 存储所有分数
             )
     
@@ -918,7 +991,7 @@ class ProcessingEngine:
             recruit_count=int(position.get('招考人数', 0)) if position.get('招考人数') else 0,
             candidate_count=0,
             min_score=None,
-            status="无法匹配",
+            status=PositionStatus.UNMATCHED,
             notes="在面试名单中找不到对应的岗位",
             all_scores=[]
         )
@@ -974,15 +1047,28 @@ class ProcessingEngine:
             Dict[str, Any]: 统计信息
         """
         try:
+            # 单次遍历汇总状态、分数和面试人员统计
+            status_counts = [0] * len(PositionStatus)
+            valid_scores = []
+            total_candidates = 0
+            positions_with_candidates = 0
+            
+            for r in results:
+                status_counts[r.status] += 1
+                if r.min_score is not None:
+                    valid_scores.append(r.min_score)
+                total_candidates += r.candidate_count
+                if r.candidate_count > 0:
+                    positions_with_candidates += 1
+            
             # 基本统计
             total_positions = len(results)
-            normal_positions = len([r for r in results if r.status == "正常"])
-            no_interview_positions = len([r for r in results if r.status == "无面试人员"])
-            unmatched_positions = len([r for r in results if r.status == "无法匹配"])
-            error_positions = len([r for r in results if r.status == "数据异常"])
+            normal_positions = status_counts[PositionStatus.NORMAL]
+            no_interview_positions = status_counts[PositionStatus.NO_INTERVIEW]
+            unmatched_positions = status_counts[PositionStatus.UNMATCHED]
+            error_positions = status_counts[PositionStatus.DATA_ERROR]
             
             # 分数统计
-            valid_scores = [r.min_score for r in results if r.min_score is not None]
             score_stats = {}
             if valid_scores:
                 score_stats = {
@@ -992,10 +1078,6 @@ class ProcessingEngine:
                     'score_count': len(valid_scores)
                 }
             
-            # 面试人员统计
-            total_candidates = sum(r.candidate_count for r in results)
-            positions_with_candidates = len([r for r in results if r.candidate_count > 0])
-            
             # 匹配统计
             match_stats = match_results.get('statistics', {})
             
@@ -1052,12 +1134,42 @@ class ProcessingEngine:
         
         self.logger.info(f"处理进度 [{step_number}/{self._total_steps}] {step_name}: {message}")
         
-        # 调用进度回调函数
-        if self.progress_callback:
-            try:
-                self.progress_callback(progress)
-            except Exception as e:
-                self.logger.warning(f"进度回调函数执行失败: {str(e)}")
+        if not self.progress_callback:
+            return
+        
+        # 步骤切换时始终回调（每次处理最多7次）；同一步骤内过密的更新只保留最新一条，
+        # 在下一次回调时机（间隔到期后的更新、步骤切换或处理结束）补发
+        now = time.perf_counter()
+        if step_number == self._last_progress_step:
+            if now - self._last_progress_ts < self.PROGRESS_THROTTLE_INTERVAL:
+                self._pending_progress = progress
+                return
+        else:
+            self._flush_progress()
+        
+        self._pending_progress = None
+        self._emit_progress(progress, now)
+    
+    def _flush_progress(self):
+        """补发被节流暂存的最新进度"""
+        if self._pending_progress is not None:
+            pending, self._pending_progress = self._pending_progress, None
+            self._emit_progress(pending, time.perf_counter())
+    
+    def _emit_progress(self, progress: ProcessingProgress, now: float):
+        """
+        调用进度回调函数并记录回调时间和步骤
+        
+        Args:
+            progress: 进度信息
+            now: 当前时间（time.perf_counter）
+        """
+        self._last_progress_ts = now
+        self._last_progress_step = progress.step_number
+        try:
+            self.progress_callback(progress)
+        except Exception as e:
+            self.logger.warning(f"进度回调函数执行失败: {str(e)}")
     
     def get_processing_status(self) -> Dict[str, Any]:
         """
@@ -1175,22 +1287,7 @@ class ProcessingEngine:
             return ""
         
         try:
-            # 转换为字符串并清理
-            text_str = str(text).strip()
-            
-            # 移除多余的空白字符
-            import re
-            text_str = re.sub(r'\s+', ' ', text_str)
-            
-            # 移除特殊字符（保留中文、英文、数字和常用标点）
-            text_str = re.sub(r'[^\w\u4e00-\u9fff\s\-\(\)（）]', '', text_str)
-            
-            # 处理常见的编码问题
-            if text_str.lower() in ['nan', 'null', 'none', '']:
-                return ""
-            
-            return text_str.strip()
-            
+            return _normalize_text(str(text))
         except Exception:
             return ""
     
@@ -1204,6 +1301,13 @@ class ProcessingEngine:
         Returns:
             Optional[float]: 标准化后的分数，无效时返回None
         """
+        # 快速路径：pandas读取的数值列绝大多数已是float/int
+        score_type = type(score)
+        if score_type is float:
+            return round(score, 2) if 0.0 <= score <= 100.0 else None
+        if score_type is int:
+            return float(score) if 0 <= score <= 100 else None
+        
         if score is None:
             return None
         
@@ -1216,8 +1320,8 @@ class ProcessingEngine:
             
             score_float = float(score)
             
-            # 验证分数范围（只检查非负数）
-            if score_float >= 0:
+            # 验证分数范围（0-100）
+            if 0 <= score_float <= 100:
                 return round(score_float, 2)  # 保留两位小数
             else:
                 return None
@@ -1253,12 +1357,11 @@ class ProcessingEngine:
                 return validation_report
             
             # 统计各种状态的岗位
-            status_counts = {}
+            status_counts = [0] * len(PositionStatus)
             score_values = []
             
             for result in results:
-                status = result.status
-                status_counts[status] = status_counts.get(status, 0) + 1
+                status_counts[result.status] += 1
                 
                 if result.min_score is not None:
                     score_values.append(result.min_score)
@@ -1271,15 +1374,15 @@ class ProcessingEngine:
                     validation_report['validation_errors'].append(f"岗位 '{result.position_name}' 的候选人数量无效: {result.candidate_count}")
             
             # 计算质量指标
-            normal_count = status_counts.get('正常', 0)
+            normal_count = status_counts[PositionStatus.NORMAL]
             success_rate = normal_count / len(results) if results else 0
             
             validation_report['quality_metrics'] = {
                 'success_rate': f"{success_rate:.1%}",
                 'normal_positions': normal_count,
-                'no_interview_positions': status_counts.get('无面试人员', 0),
-                'unmatched_positions': status_counts.get('无法匹配', 0),
-                'error_positions': status_counts.get('数据异常', 0),
+                'no_interview_positions': status_counts[PositionStatus.NO_INTERVIEW],
+                'unmatched_positions': status_counts[PositionStatus.UNMATCHED],
+                'error_positions': status_counts[PositionStatus.DATA_ERROR],
                 'avg_score': sum(score_values) / len(score_values) if score_values else 0,
                 'min_score': min(score_values) if score_values else None,
                 'max_score': max(score_values) if score_values else None
@@ -1290,12 +1393,12 @@ class ProcessingEngine:
                 validation_report['validation_warnings'].append(f"成功处理率较低 ({success_rate:.1%})，建议检查数据质量")
                 validation_report['recommendations'].append("检查职位表和面试名单的岗位名称一致性")
             
-            if status_counts.get('无法匹配', 0) > 0:
-                validation_report['validation_warnings'].append(f"有 {status_counts['无法匹配']} 个岗位无法匹配")
+            if status_counts[PositionStatus.UNMATCHED] > 0:
+                validation_report['validation_warnings'].append(f"有 {status_counts[PositionStatus.UNMATCHED]} 个岗位无法匹配")
                 validation_report['recommendations'].append("考虑使用更宽松的匹配条件或手动映射")
             
-            if status_counts.get('数据异常', 0) > 0:
-                validation_report['validation_warnings'].append(f"有 {status_counts['数据异常']} 个岗位存在数据异常")
+            if status_counts[PositionStatus.DATA_ERROR] > 0:
+                validation_report['validation_warnings'].append(f"有 {status_counts[PositionStatus.DATA_ERROR]} 个岗位存在数据异常")
                 validation_report['recommendations'].append("检查面试数据的完整性和格式")
             
             # 如果有错误，标记为无效
@@ -1320,6 +1423,9 @@ class ProcessingEngine:
         """重置处理状态"""
         self._current_step = 0
         self._start_time = None
+        self._last_progress_ts = 0.0
+        self._last_progress_step = None
+        self._pending_progress = None
         self._processing_errors.clear()
         self._processing_warnings.clear()
         self.data_validator.clear_validation_results()
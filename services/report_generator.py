@@ -2,22 +2,54 @@
 报告生成器
 负责生成Excel格式的岗位分数汇总报告
 """
+import os
 import pandas as pd
 from datetime import datetime
 from typing import List, Optional, Tuple
 from pathlib import Path
 import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils.dataframe import dataframe_to_rows
 
-from models.data_models import PositionScoreResult
+try:
+    import xlsxwriter
+except ImportError:  # 可选依赖，仅在显式选择xlsxwriter写出引擎时需要
+    xlsxwriter = None
+
+from models.data_models import PositionScoreResult, PositionStatus
 from services.file_manager import FileManager
 
 
+# 报告表头 - 包含岗位表中的重要列
+REPORT_HEADERS = ['岗位代码', '岗位名称', '用人司局', '部门名称', '招考人数', '面试人数', '面试分数', '状态', '备注']
+# 各列宽度
+REPORT_COLUMN_WIDTHS = [12, 25, 15, 15, 12, 12, 30, 15, 20]
+# 数据单元格命名样式
+DATA_STYLE_NAME = 'report_data'
+# 支持的报告写出引擎
+WRITER_ENGINES = ('openpyxl', 'xlsxwriter')
+
+
 class ReportGenerator:
     """Excel报告生成器"""
     
-    def __init__(self):
+    def __init__(self, writer_engine: str = 'openpyxl'):
+        """
+        初始化报告生成器
+        
+        Args:
+            writer_engine: 报告写出引擎，默认 "openpyxl"；
+                "xlsxwriter" 使用常量内存模式写出，需安装xlsxwriter
+                
+        Raises:
+            ValueError: 写出引擎不受支持或未安装
+        """
+        if writer_engine not in WRITER_ENGINES:
+            raise ValueError(f"不支持的报告写出引擎: {writer_engine}")
+        if writer_engine == 'xlsxwriter' and xlsxwriter is None:
+            raise ValueError("使用xlsxwriter写出引擎需要先安装xlsxwriter")
+        self.writer_engine = writer_engine
         self.report_title = "岗位最低进面分数汇总报告"
         self.generated_time = None
         self.file_manager = FileManager()
@@ -39,7 +71,7 @@ class ReportGenerator:
             # 处理保存路径
             processed_path = self.file_manager.get_save_path(output_path)
             
-            # 验证路径有效性
+            # 验证路径有效性（写出前重新检查，文件系统可能在调用validate_output_path后发生变化）
             is_valid, error_msg = self.file_manager.validate_save_path(processed_path)
             if not is_valid:
                 raise Exception(f"保存路径无效: {error_msg}")
@@ -53,114 +85,203 @@ class ReportGenerator:
             
             self.generated_time = datetime.now()
             
-            # 创建工作簿和工作表
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "岗位分数汇总"
-            
-            # 添加报告头部
-            self._add_report_header(ws)
-            
-            # 添加数据表格
-            self._add_data_table(ws, results)
+            # 按构造时选择的写出引擎写出报告
+            if self.writer_engine == 'xlsxwriter':
+                self._write_with_xlsxwriter(results, final_path)
+            else:
+                self._write_with_openpyxl(results, final_path)
             
-            # 应用样式
-            self._apply_styles(ws, len(results))
-            
-            # 保存文件
-            wb.save(final_path)
             return True, final_path
             
         except Exception as e:
             raise Exception(f"生成报告失败: {str(e)}")
     
+    def _write_with_openpyxl(self, results: List[PositionScoreResult], file_path: str):
+        """使用openpyxl只写模式写出报告，按行流式写出，内存占用与数据量无关"""
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("岗位分数汇总")
+        
+        # 数据单元格样式注册为命名样式，每个单元格只需按名称引用一次
+        wb.add_named_style(self._data_style())
+        
+        # 调整列宽（只写模式下需在写入数据前设置）
+        self._apply_column_widths(ws)
+        
+        # 添加报告头部
+        self._add_report_header(ws)
+        
+        # 添加数据表格
+        self._add_data_table(ws, results)
+        
+        # 保存文件
+        wb.save(file_path)
+    
+    def _write_with_xlsxwriter(self, results: List[PositionScoreResult], file_path: str):
+        """使用xlsxwriter常量内存模式写出报告，每行写出后即刷新到磁盘"""
+        wb = xlsxwriter.Workbook(file_path, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+        try:
+            ws = wb.add_worksheet("岗位分数汇总")
+            
+            title_format = wb.add_format({
+                'font_name': '微软雅黑', 'font_size': 16, 'bold': True,
+                'align': 'center', 'valign': 'vcenter'
+            })
+            time_format = wb.add_format({'font_name': '微软雅黑', 'font_size': 10, 'align': 'center'})
+            header_format = wb.add_format({
+                'font_name': '微软雅黑', 'font_size': 11, 'bold': True, 'font_color': '#FFFFFF',
+                'bg_color': '#366092', 'align': 'center', 'valign': 'vcenter', 'border': 1
+            })
+            data_format = wb.add_format({
+                'font_name': '微软雅黑', 'font_size': 10,
+                'align': 'center', 'valign': 'vcenter', 'border': 1
+            })
+            
+            # 调整列宽
+            for col, width in enumerate(REPORT_COLUMN_WIDTHS):
+                ws.set_column(col, col, width)
+            
+            # 报告标题和生成时间（常量内存模式下需按行顺序写出）
+            last_col = len(REPORT_HEADERS) - 1
+            ws.merge_range(0, 0, 0, last_col, self.report_title, title_format)
+            ws.merge_range(1, 0, 1, last_col, self._generated_time_text(), time_format)
+            
+            # 表头（第3行为空行）
+            ws.write_row(3, 0, REPORT_HEADERS, header_format)
+            
+            # 数据行（循环外绑定方法，减少每行的属性查找）
+            write_row = ws.write_row
+            row_values = self._row_values
+            for row_idx, result in enumerate(results, 4):
+                write_row(row_idx, 0, row_values(result), data_format)
+        except BaseException:
+            # xlsxwriter在close时才把内容写到目标路径，出错时关闭工作簿释放临时文件，
+            # 并删除写出的不完整报告，不把截断的文件留给用户
+            try:
+                wb.close()
+            finally:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            raise
+        
+        wb.close()
+    
+    def _generated_time_text(self) -> str:
+        """报告生成时间文本"""
+        return f"生成时间: {self.generated_time.strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    def _row_values(self, result: PositionScoreResult) -> list:
+        """获取单个岗位结果在报告中的一行数据"""
+        return [
+            result.position_code,
+            result.position_name,
+            result.department,  # 用人司局
+            result.department_name,  # 部门名称
+            result.recruit_count,  # 招考人数
+            result.candidate_count,  # 面试人数
+            result.scores_text or "无数据",  # 面试分数 - 显示所有分数而不是最低分
+            result.status.label,
+            result.notes
+        ]
+    
+    def _styled_cell(self, worksheet, value, font=None, alignment=None, fill=None, border=None) -> WriteOnlyCell:
+        """创建带样式的只写单元格（只写模式下样式必须在写入前设置）"""
+        cell = WriteOnlyCell(worksheet, value=value)
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        if fill is not None:
+            cell.fill = fill
+        if border is not None:
+            cell.border = border
+        return cell
+    
     def _add_report_header(self, worksheet):
         """添加报告头部信息"""
         # 报告标题
-        worksheet['A1'] = self.report_title
-        worksheet.merge_cells('A1:I1')
+        title_cell = self._styled_cell(
+            worksheet, self.report_title,
+            font=Font(name='微软雅黑', size=16, bold=True),
+            alignment=Alignment(horizontal='center', vertical='center')
+        )
+        worksheet.append([title_cell])
+        worksheet.merged_cells.add('A1:I1')
         
         # 生成时间
-        worksheet['A2'] = f"生成时间: {self.generated_time.strftime('%Y-%m-%d %H:%M:%S')}"
-        worksheet.merge_cells('A2:I2')
+        time_cell = self._styled_cell(
+            worksheet, self._generated_time_text(),
+            font=Font(name='微软雅黑', size=10),
+            alignment=Alignment(horizontal='center')
+        )
+        worksheet.append([time_cell])
+        worksheet.merged_cells.add('A2:I2')
         
         # 空行
-        worksheet['A3'] = ""
+        worksheet.append([])
         
-        # 表头 - 包含岗位表中的重要列
-        headers = ['岗位代码', '岗位名称', '用人司局', '部门名称', '招考人数', '面试人数', '面试分数', '状态', '备注']
-        for col, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=4, column=col)
-            cell.value = header
+        # 表头
+        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+        header_font = Font(name='微软雅黑', size=11, bold=True, color='FFFFFF')
+        header_alignment = Alignment(horizontal='center', vertical='center')
+        worksheet.append([
+            self._styled_cell(worksheet, header, font=header_font, alignment=header_alignment,
+                              fill=header_fill, border=self._thin_border())
+            for header in REPORT_HEADERS
+        ])
     
     def _add_data_table(self, worksheet, results: List[PositionScoreResult]):
         """添加数据表格"""
-        start_row = 5
-        
-        for row_idx, result in enumerate(results, start_row):
-            worksheet.cell(row=row_idx, column=1, value=result.position_code)
-            worksheet.cell(row=row_idx, column=2, value=result.position_name)
-            worksheet.cell(row=row_idx, column=3, value=result.department)  # 用人司局
-            worksheet.cell(row=row_idx, column=4, value=result.department_name)  # 部门名称
-            worksheet.cell(row=row_idx, column=5, value=result.recruit_count)  # 招考人数
-            worksheet.cell(row=row_idx, column=6, value=result.candidate_count)  # 面试人数
-            # 面试分数 - 显示所有分数而不是最低分
-            scores_text = ', '.join(map(str, result.all_scores)) if result.all_scores else "无数据"
-            worksheet.cell(row=row_idx, column=7, value=scores_text)
-            worksheet.cell(row=row_idx, column=8, value=result.status)
-            worksheet.cell(row=row_idx, column=9, value=result.notes)
-    
-    def _apply_styles(self, worksheet, data_rows: int):
-        """应用样式格式"""
-        # 标题样式
-        title_cell = worksheet['A1']
-        title_cell.font = Font(name='微软雅黑', size=16, bold=True)
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # 时间样式
-        time_cell = worksheet['A2']
-        time_cell.font = Font(name='微软雅黑', size=10)
-        time_cell.alignment = Alignment(horizontal='center')
-        
-        # 表头样式
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_font = Font(name='微软雅黑', size=11, bold=True, color='FFFFFF')
+        # 循环外绑定方法，减少每行的属性查找
+        append = worksheet.append
+        row_values = self._row_values
         
-        for col in range(1, 10):  # A到I列
-            cell = worksheet.cell(row=4, column=col)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # 数据行样式
-        data_font = Font(name='微软雅黑', size=10)
-        border = Border(
+        for result in results:
+            row = []
+            for value in row_values(result):
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.style = DATA_STYLE_NAME
+                row.append(cell)
+            append(row)
+    
+    def _data_style(self) -> NamedStyle:
+        """数据单元格样式"""
+        return NamedStyle(
+            name=DATA_STYLE_NAME,
+            font=Font(name='微软雅黑', size=10),
+            alignment=Alignment(horizontal='center', vertical='center'),
+            border=self._thin_border()
+        )
+    
+    def _thin_border(self) -> Border:
+        """表格细边框"""
+        return Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
             top=Side(style='thin'),
             bottom=Side(style='thin')
         )
-        
-        # 应用到所有数据单元格
-        for row in range(4, 5 + data_rows):  # 包括表头和数据行
-            for col in range(1, 10):
-                cell = worksheet.cell(row=row, column=col)
-                cell.border = border
-                if row > 4:  # 数据行
-                    cell.font = data_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # 调整列宽
-        column_widths = [12, 25, 15, 15, 12, 12, 30, 15, 20]
-        for col, width in enumerate(column_widths, 1):
+    
+    def _apply_column_widths(self, worksheet):
+        """设置列宽"""
+        for col, width in enumerate(REPORT_COLUMN_WIDTHS, 1):
             worksheet.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
     
     def create_summary_statistics(self, results: List[PositionScoreResult]) -> dict:
         """创建汇总统计信息"""
+        # 按状态值索引计数，单次遍历
+        status_counts = [0] * len(PositionStatus)
+        for r in results:
+            status_counts[r.status] += 1
+        
         total_positions = len(results)
-        normal_positions = len([r for r in results if r.status == "正常"])
-        no_interview_positions = len([r for r in results if r.status == "无面试人员"])
-        error_positions = len([r for r in results if r.status == "数据异常"])
+        normal_positions = status_counts[PositionStatus.NORMAL]
+        no_interview_positions = status_counts[PositionStatus.NO_INTERVIEW]
+        error_positions = status_counts[PositionStatus.DATA_ERROR]
         
         return {
             "total_positions": total_positions,
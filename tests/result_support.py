@@ -0,0 +1,27 @@
+"""
+测试用岗位分数结果构造函数
+"""
+from typing import Iterable, List, Optional, Tuple
+
+from models.data_models import PositionScoreResult
+
+# 结果表的一行：(岗位代码, 岗位名称, 用人司局, 最低分数, 面试人数, 岗位状态, 备注)
+ResultRow = Tuple[str, str, str, Optional[float], int, str, str]
+
+
+def make_results(rows: Iterable[ResultRow], recruit_count: int = 1) -> List[PositionScoreResult]:
+    """
+    按元组表批量构造岗位分数结果，部门名称留空
+
+    Args:
+        rows: 结果表，每行字段顺序见 ResultRow
+        recruit_count: 每个岗位的招考人数
+
+    Returns:
+        岗位分数结果列表
+    """
+    return [
+        PositionScoreResult(code, name, department, '', recruit_count,
+                            candidate_count, min_score, status, notes)
+        for code, name, department, min_score, candidate_count, status, notes in rows
+    ]
@@ -1,30 +1,34 @@
 """
 配置加载器测试
 """
+import copy
 import json
 import os
-import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from utils.config_loader import ConfigLoader, ConfigValidationError
+from tmp_support import TempDirTestCase
 
 
-class TestConfigLoader(unittest.TestCase):
+class TestConfigLoader(TempDirTestCase):
     """配置加载器测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的初始配置"""
+        super().setUpClass()
+        # 只加载一次配置，各测试使用其副本，避免重复读取和验证
+        pristine_loader = ConfigLoader(os.path.join(cls._root, "pristine.json"))
+        cls._pristine = pristine_loader.load_config()
+    
     def setUp(self):
         """测试前准备"""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.config_file = Path(self.temp_dir) / "test_config.json"
         self.loader = ConfigLoader(str(self.config_file))
-    
-    def tearDown(self):
-        """测试后清理"""
-        if self.config_file.exists():
-            self.config_file.unlink()
-        os.rmdir(self.temp_dir)
+        self.loader._config = copy.deepcopy(self._pristine)
     
     def test_load_default_config_when_file_not_exists(self):
         """测试文件不存在时加载默认配置"""
@@ -79,94 +83,8 @@ class TestConfigLoader(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             self.loader.load_config()
     
-    def test_config_validation_success(self):
-        """测试配置验证成功"""
-        valid_config = {
-            "app_config": {
-                "window_title": "测试",
-                "window_size": "800x600"
-            },
-            "matching_config": {
-                "fuzzy_threshold": 0.8,
-                "ignore_case": True
-            },
-            "logging_config": {
-                "level": "DEBUG",
-                "log_file": "test.log"
-            }
-        }
-        
-        # 应该不抛出异常
-        self.loader._validate_config(valid_config)
-    
-    def test_config_validation_type_error(self):
-        """测试配置类型验证错误"""
-        invalid_config = {
-            "app_config": {
-                "window_title": 123  # 应该是字符串
-            }
-        }
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.loader._validate_config(invalid_config)
-        
-        self.assertIn("类型错误", str(cm.exception))
-    
-    def test_config_validation_fuzzy_threshold_range(self):
-        """测试模糊匹配阈值范围验证"""
-        invalid_config = {
-            "matching_config": {
-                "fuzzy_threshold": 1.5  # 超出范围
-            }
-        }
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.loader._validate_config(invalid_config)
-        
-        self.assertIn("fuzzy_threshold", str(cm.exception))
-    
-    def test_config_validation_log_level(self):
-        """测试日志级别验证"""
-        invalid_config = {
-            "logging_config": {
-                "level": "INVALID_LEVEL"
-            }
-        }
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.loader._validate_config(invalid_config)
-        
-        self.assertIn("日志级别", str(cm.exception))
-    
-    def test_config_validation_window_size(self):
-        """测试窗口大小格式验证"""
-        invalid_config = {
-            "app_config": {
-                "window_size": "invalid_size"
-            }
-        }
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.loader._validate_config(invalid_config)
-        
-        self.assertIn("window_size", str(cm.exception))
-    
-    def test_window_size_validation(self):
-        """测试窗口大小验证方法"""
-        # 有效格式
-        self.assertTrue(self.loader._is_valid_window_size("800x600"))
-        self.assertTrue(self.loader._is_valid_window_size("1920x1080"))
-        
-        # 无效格式
-        self.assertFalse(self.loader._is_valid_window_size("800"))
-        self.assertFalse(self.loader._is_valid_window_size("800x"))
-        self.assertFalse(self.loader._is_valid_window_size("800xabc"))
-        self.assertFalse(self.loader._is_valid_window_size("0x600"))
-    
     def test_get_config_sections(self):
         """测试获取配置节"""
-        self.loader.load_config()
-        
         app_config = self.loader.get_app_config()
         matching_config = self.loader.get_matching_config()
         logging_config = self.loader.get_logging_config()
@@ -181,8 +99,6 @@ class TestConfigLoader(unittest.TestCase):
     
     def test_get_config_value(self):
         """测试获取配置值"""
-        self.loader.load_config()
-        
         # 获取存在的值
         title = self.loader.get_config_value("app_config", "window_title")
         self.assertEqual(title, "Excel岗位分数查询工具")
@@ -197,8 +113,6 @@ class TestConfigLoader(unittest.TestCase):
     
     def test_set_config_value(self):
         """测试设置配置值"""
-        self.loader.load_config()
-        
         # 设置现有节的新值
         self.loader.set_config_value("app_config", "new_key", "new_value")
         value = self.loader.get_config_value("app_config", "new_key")
@@ -211,8 +125,6 @@ class TestConfigLoader(unittest.TestCase):
     
     def test_update_config(self):
         """测试批量更新配置"""
-        self.loader.load_config()
-        
         updates = {
             "app_config": {
                 "window_title": "新标题",
@@ -232,8 +144,6 @@ class TestConfigLoader(unittest.TestCase):
     
     def test_update_config_validation_error(self):
         """测试更新配置时的验证错误"""
-        self.loader.load_config()
-        
         invalid_updates = {
             "matching_config": {
                 "fuzzy_threshold": 2.0  # 超出范围
@@ -260,11 +170,33 @@ class TestConfigLoader(unittest.TestCase):
         new_config = new_loader.load_config()
         
         self.assertEqual(new_config["app_config"]["test_key"], "test_value")
-    
+
+    def test_save_and_load_without_orjson(self):
+        """测试未安装orjson时回退到标准库json"""
+        with patch('utils.config_loader.orjson', None):
+            self.loader.load_config()
+            self.loader.set_config_value("app_config", "window_title", "回退测试")
+            self.loader.save_config()
+
+            new_config = ConfigLoader(str(self.config_file)).load_config()
+
+        self.assertEqual(new_config["app_config"]["window_title"], "回退测试")
+
+    def test_save_config_format(self):
+        """测试保存的配置文件使用4空格缩进且中文不转义"""
+        self.loader.load_config()
+        self.loader.save_config()
+
+        expected = json.dumps(self.loader._config, ensure_ascii=False, indent=4)
+        self.assertEqual(self.config_file.read_text(encoding='utf-8'), expected)
+
     def test_save_config_io_error(self):
         """测试保存配置时的IO错误"""
-        # 使用无效路径（包含非法字符）
-        invalid_file = Path("invalid<>path/config.json")
+        # 父路径是已存在的普通文件，任何平台上都无法创建目录；
+        # 路径位于本测试的临时目录内，不会在工作目录留下文件，可安全并行运行
+        blocker = Path(self.temp_dir) / "not_a_dir"
+        blocker.touch()
+        invalid_file = blocker / "config.json"
         loader = ConfigLoader(str(invalid_file))
         loader._config = {"test": "value"}
         
@@ -273,7 +205,6 @@ class TestConfigLoader(unittest.TestCase):
     
     def test_reset_to_defaults(self):
         """测试重置为默认配置"""
-        self.loader.load_config()
         self.loader.set_config_value("app_config", "window_title", "修改的标题")
         
         # 验证修改生效
@@ -286,7 +217,17 @@ class TestConfigLoader(unittest.TestCase):
         # 验证重置结果（直接访问内存中的配置）
         title = self.loader._config["app_config"]["window_title"]
         self.assertEqual(title, "Excel岗位分数查询工具")
-    
+
+    def test_default_config_not_mutated(self):
+        """测试修改配置不会影响默认配置模板"""
+        self.loader.reset_to_defaults()
+        self.loader.set_config_value("app_config", "window_title", "修改的标题")
+
+        self.assertEqual(ConfigLoader.DEFAULT_CONFIG["app_config"]["window_title"],
+                         "Excel岗位分数查询工具")
+        with self.assertRaises(TypeError):
+            ConfigLoader.DEFAULT_CONFIG["app_config"]["window_title"] = "x"
+
     def test_get_config_info(self):
         """测试获取配置信息"""
         self.loader.load_config()
@@ -300,6 +241,119 @@ class TestConfigLoader(unittest.TestCase):
         self.assertTrue(info["file_exists"])
         self.assertEqual(len(info["sections"]), 3)  # app_config, matching_config, logging_config
         self.assertGreater(info["total_keys"], 0)
+
+
+class TestConfigLoaderPure(unittest.TestCase):
+    """配置加载器纯逻辑测试类，不涉及文件系统"""
+    
+    def setUp(self):
+        """测试前准备"""
+        self.loader = ConfigLoader("/nonexistent/config.json")
+    
+    def test_config_validation_success(self):
+        """测试配置验证成功"""
+        valid_config = {
+            "app_config": {
+                "window_title": "测试",
+                "window_size": "800x600"
+            },
+            "matching_config": {
+                "fuzzy_threshold": 0.8,
+                "ignore_case": True
+            },
+            "logging_config": {
+                "level": "DEBUG",
+                "log_file": "test.log"
+            }
+        }
+        
+        # 应该不抛出异常
+        self.loader._validate_config(valid_config)
+    
+    def test_config_validation_type_error(self):
+        """测试配置类型验证错误"""
+        invalid_config = {
+            "app_config": {
+                "window_title": 123  # 应该是字符串
+            }
+        }
+        
+        with self.assertRaises(ConfigValidationError) as cm:
+            self.loader._validate_config(invalid_config)
+        
+        self.assertIn("类型错误", str(cm.exception))
+    
+    def test_config_validation_fuzzy_threshold_range(self):
+        """测试模糊匹配阈值范围验证"""
+        invalid_config = {
+            "matching_config": {
+                "fuzzy_threshold": 1.5  # 超出范围
+            }
+        }
+        
+        with self.assertRaises(ConfigValidationError) as cm:
+            self.loader._validate_config(invalid_config)
+        
+        self.assertIn("fuzzy_threshold", str(cm.exception))
+    
+    def test_config_validation_log_level(self):
+        """测试日志级别验证"""
+        invalid_config = {
+            "logging_config": {
+                "level": "INVALID_LEVEL"
+            }
+        }
+        
+        with self.assertRaises(ConfigValidationError) as cm:
+            self.loader._validate_config(invalid_config)
+        
+        self.assertIn("日志级别", str(cm.exception))
+    
+    def test_config_validation_window_size(self):
+        """测试窗口大小格式验证"""
+        invalid_config = {
+            "app_config": {
+                "window_size": "invalid_size"
+            }
+        }
+        
+        with self.assertRaises(ConfigValidationError) as cm:
+            self.loader._validate_config(invalid_config)
+        
+        self.assertIn("window_size", str(cm.exception))
+    
+    def test_window_size_validation(self):
+        """测试窗口大小验证方法"""
+        # 有效格式
+        self.assertTrue(self.loader._is_valid_window_size("800x600"))
+        self.assertTrue(self.loader._is_valid_window_size("1920x1080"))
+        
+        # 无效格式
+        self.assertFalse(self.loader._is_valid_window_size("800"))
+        self.assertFalse(self.loader._is_valid_window_size("800x"))
+        self.assertFalse(self.loader._is_valid_window_size("800xabc"))
+        self.assertFalse(self.loader._is_valid_window_size("0x600"))
+    
+    def test_window_size_validation_matches_int_parsing(self):
+        """测试窗口大小验证与按 int() 解析宽高的结果一致"""
+        def parse_with_int(size_str):
+            parts = size_str.split('x')
+            if len(parts) != 2:
+                return False
+            try:
+                return int(parts[0]) > 0 and int(parts[1]) > 0
+            except ValueError:
+                return False
+        
+        cases = [" 800x600", "800x600 ", "0800x600", "+800x600", "1_024x768", "８００x６００",
+                 "-800x600", "800x0", "800x-0", "800x_600", "800x6__00", "800x600x400",
+                 "800 x 600", "800X600", "x600", "", "1e3x600"]
+        for size_str in cases:
+            with self.subTest(size_str=size_str):
+                self.assertEqual(self.loader._is_valid_window_size(size_str), parse_with_int(size_str))
+        
+        self.assertTrue(self.loader._is_valid_window_size(" 800x600"))
+        self.assertTrue(self.loader._is_valid_window_size("0800x600"))
     
     def test_merge_with_defaults(self):
         """测试与默认配置合并"""
@@ -0,0 +1,96 @@
+"""
+数据模型测试
+"""
+import unittest
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.data_models import PositionScoreResult, PositionStatus
+
+
+def _result(status, **kwargs) -> PositionScoreResult:
+    """构造只关心状态、分数和备注的岗位分数结果"""
+    fields = dict(min_score=None, notes='')
+    fields.update(kwargs)
+    return PositionScoreResult('P001', '软件工程师', '技术部', '', 1, 0, status=status, **fields)
+
+
+class TestPositionScoreResultStatus(unittest.TestCase):
+    """岗位状态解析测试类"""
+
+    def test_status_from_label(self):
+        """测试状态文本转换为状态枚举"""
+        for label, expected in [('正常', PositionStatus.NORMAL), (' 无面试人员 ', PositionStatus.NO_INTERVIEW),
+                                ('无法匹配', PositionStatus.UNMATCHED), ('数据异常', PositionStatus.DATA_ERROR)]:
+            with self.subTest(label=label):
+                self.assertIs(_result(label).status, expected)
+
+    def test_status_from_enum_value(self):
+        """测试直接传入状态枚举或状态值"""
+        self.assertIs(_result(PositionStatus.UNMATCHED).status, PositionStatus.UNMATCHED)
+        self.assertIs(_result(1).status, PositionStatus.NO_INTERVIEW)
+
+    def test_unknown_status_label(self):
+        """测试未知或空的状态文本按数据异常处理并记录警告"""
+        for label in ['', '待定']:
+            with self.subTest(label=label):
+                with self.assertLogs('models.data_models', level='WARNING') as logs:
+                    result = _result(label)
+                self.assertIs(result.status, PositionStatus.DATA_ERROR)
+                self.assertIn('状态文本未知', logs.output[0])
+
+    def test_from_label_rejects_unknown_label(self):
+        """测试 from_label 对未知状态文本抛出异常"""
+        with self.assertRaises(ValueError):
+            PositionStatus.from_label('待定')
+
+
+class TestPositionScoreResultDerivedFields(unittest.TestCase):
+    """分数文本和默认备注生成测试类"""
+
+    def test_scores_text_generated_from_all_scores(self):
+        """测试未提供分数文本时根据所有分数生成"""
+        result = _result('数据异常', all_scores=[90.0, 85.5])
+
+        self.assertEqual(result.scores_text, '90.0, 85.5')
+
+    def test_scores_text_supplied_is_kept(self):
+        """测试显式提供的分数文本不被覆盖"""
+        result = _result('正常', all_scores=[90.0, 85.5], scores_text='90, 85.5')
+
+        self.assertEqual(result.scores_text, '90, 85.5')
+        self.assertEqual(result.notes, '共2人，分数: [90, 85.5]')
+
+    def test_normal_result_without_notes(self):
+        """测试正常岗位未提供备注时使用分数汇总作为备注"""
+        result = _result('正常', min_score=85.5, all_scores=[90.0, 85.5])
+
+        self.assertEqual(result.notes, '共2人，分数: [90.0, 85.5]')
+
+    def test_normal_result_with_notes(self):
+        """测试正常岗位已提供的备注保持不变"""
+        result = _result('正常', all_scores=[90.0], notes=' 人工核对 ')
+
+        self.assertEqual(result.notes, '人工核对')
+
+    def test_non_normal_result_without_notes(self):
+        """测试非正常岗位不生成默认备注"""
+        for status in [PositionStatus.NO_INTERVIEW, PositionStatus.UNMATCHED, PositionStatus.DATA_ERROR]:
+            with self.subTest(status=status):
+                result = _result(status, all_scores=[90.0])
+                self.assertEqual(result.scores_text, '90.0')
+                self.assertEqual(result.notes, '')
+
+    def test_without_scores(self):
+        """测试没有分数时分数文本和备注均为空"""
+        result = _result('正常')
+
+        self.assertEqual(result.scores_text, '')
+        self.assertEqual(result.notes, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
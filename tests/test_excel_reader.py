@@ -0,0 +1,116 @@
+"""
+Excel读取器测试
+"""
+import unittest
+import os
+import sys
+import math
+import pandas as pd
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.excel_reader import ExcelReader
+
+
+def _rowwise_position_info(position_sheets: dict) -> list:
+    """按原先的逐行iterrows方式提取职位信息，作为按列提取结果的对照"""
+    positions = []
+    for sheet_name, df in position_sheets.items():
+        for _, row in df.iterrows():
+            position_info = {
+                'sheet_name': sheet_name,
+                'position_name': row.get('position_name', ''),
+                'position_code': row.get('position_code', ''),
+                'department': row.get('department', sheet_name),
+                'row_index': row.name
+            }
+            if position_info['position_name']:
+                positions.append(position_info)
+    return positions
+
+
+def _rowwise_interview_info(interview_df: pd.DataFrame) -> list:
+    """按原先的逐行iterrows方式提取面试信息，作为按列提取结果的对照"""
+    interviews = []
+    for _, row in interview_df.iterrows():
+        interview_info = {
+            'name': row.get('name', ''),
+            'position_name': row.get('position_name', ''),
+            'score': row.get('score', 0.0),
+            'is_qualified': row.get('is_qualified', False),
+            'row_index': row.name
+        }
+        if interview_info['name'] and interview_info['position_name']:
+            interviews.append(interview_info)
+    return interviews
+
+
+def _comparable(records: list) -> list:
+    """将记录中的NaN统一替换为字符串，使两份记录可以直接比较"""
+    return [
+        {key: 'NaN' if isinstance(value, float) and math.isnan(value) else value
+         for key, value in record.items()}
+        for record in records
+    ]
+
+
+class TestExcelReaderExtraction(unittest.TestCase):
+    """按列提取职位和面试信息的测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.reader = ExcelReader()
+
+    def test_extract_position_info_matches_rowwise(self):
+        """测试职位信息提取结果与逐行提取一致（含空值单元格和缺失的可选列）"""
+        position_sheets = {
+            # 缺少 department 列时使用工作表名作为部门
+            '技术部': pd.DataFrame({
+                'position_name': ['软件工程师', float('nan'), '', '测试工程师'],
+                'position_code': ['P001', 'P002', 'P003', float('nan')]
+            }),
+            # 缺少 position_code 列时使用空字符串
+            '综合部': pd.DataFrame({
+                'position_name': ['文秘'],
+                'department': [float('nan')]
+            }),
+            '空表': pd.DataFrame(columns=['position_name'])
+        }
+
+        expected = _rowwise_position_info(position_sheets)
+        actual = self.reader.extract_position_info(position_sheets)
+
+        self.assertEqual(_comparable(actual), _comparable(expected))
+        # 职位名称为NaN的行与逐行提取一样被保留，空字符串的行被过滤
+        self.assertEqual([p['position_code'] for p in _comparable(actual)], ['P001', 'P002', 'NaN', ''])
+        self.assertEqual([p['department'] for p in _comparable(actual)], ['技术部', '技术部', '技术部', 'NaN'])
+
+    def test_extract_interview_info_matches_rowwise(self):
+        """测试面试信息提取结果与逐行提取一致（含空值单元格和缺失的可选列）"""
+        # 缺少 is_qualified 列时使用 False
+        interview_df = pd.DataFrame({
+            'name': ['张三', '李四', '', '王五'],
+            'position_name': ['软件工程师', '软件工程师', '测试工程师', float('nan')],
+            'score': [85.5, float('nan'), 70.0, 66.0]
+        })
+
+        expected = _rowwise_interview_info(interview_df)
+        actual = self.reader.extract_interview_info(interview_df)
+
+        self.assertEqual(_comparable(actual), _comparable(expected))
+        self.assertEqual(len(actual), 3)
+        self.assertTrue(all(record['is_qualified'] is False for record in actual))
+
+    def test_extract_interview_info_without_score_column(self):
+        """测试缺少分数列时分数默认为0.0"""
+        interview_df = pd.DataFrame({'name': ['张三'], 'position_name': ['软件工程师']})
+
+        actual = self.reader.extract_interview_info(interview_df)
+
+        self.assertEqual(_comparable(actual), _comparable(_rowwise_interview_info(interview_df)))
+        self.assertEqual(actual[0]['score'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
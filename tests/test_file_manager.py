@@ -2,27 +2,30 @@
 文件管理器测试
 """
 import unittest
-import tempfile
 import os
-import shutil
 from pathlib import Path
 from datetime import datetime
 
 from services.file_manager import FileManager
+from tmp_support import TempDirTestCase
 
 
-class TestFileManager(unittest.TestCase):
+class TestFileManager(TempDirTestCase):
     """文件管理器测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的被测对象"""
+        super().setUpClass()
+        # FileManager 不保存测试间可见的状态，所有测试共用一个实例
+        cls.file_manager = FileManager()
+    
     def setUp(self):
         """测试前准备"""
-        self.file_manager = FileManager()
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.temp_dir, "test.xlsx")
-    
-    def tearDown(self):
-        """测试后清理"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        super().setUp()
+        # 临时目录是不带结尾分隔符的绝对路径，直接拼接文件名即可
+        self._p = self.temp_dir + os.sep
+        self.test_file = self._p + "test.xlsx"
     
     def test_get_save_path_default(self):
         """测试获取默认保存路径"""
@@ -33,7 +36,7 @@ class TestFileManager(unittest.TestCase):
     
     def test_get_save_path_user_specified_file(self):
         """测试用户指定文件路径"""
-        user_path = os.path.join(self.temp_dir, "custom_report.xlsx")
+        user_path = self._p + "custom_report.xlsx"
         path = self.file_manager.get_save_path(user_path)
         
         self.assertEqual(path, os.path.abspath(user_path))
@@ -42,19 +45,19 @@ class TestFileManager(unittest.TestCase):
         """测试用户指定目录路径"""
         path = self.file_manager.get_save_path(self.temp_dir)
         
-        expected_path = os.path.join(self.temp_dir, "岗位最低分数汇总.xlsx")
+        expected_path = self._p + "岗位最低分数汇总.xlsx"
         self.assertEqual(path, os.path.abspath(expected_path))
     
     def test_get_save_path_add_extension(self):
         """测试自动添加文件扩展名"""
-        user_path = os.path.join(self.temp_dir, "report")
+        user_path = self._p + "report"
         path = self.file_manager.get_save_path(user_path)
         
         self.assertTrue(path.endswith(".xlsx"))
     
     def test_handle_file_conflict_no_conflict(self):
         """测试无冲突情况"""
-        non_existing_file = os.path.join(self.temp_dir, "new_file.xlsx")
+        non_existing_file = self._p + "new_file.xlsx"
         result_path = self.file_manager.handle_file_conflict(non_existing_file)
         
         self.assertEqual(result_path, non_existing_file)
@@ -62,8 +65,7 @@ class TestFileManager(unittest.TestCase):
     def test_handle_file_conflict_auto_rename(self):
         """测试自动重命名策略"""
         # 创建一个已存在的文件
-        with open(self.test_file, 'w') as f:
-            f.write("test")
+        Path(self.test_file).touch()
         
         result_path = self.file_manager.handle_file_conflict(self.test_file, "auto_rename")
         
@@ -73,8 +75,7 @@ class TestFileManager(unittest.TestCase):
     def test_handle_file_conflict_overwrite(self):
         """测试覆盖策略"""
         # 创建一个已存在的文件
-        with open(self.test_file, 'w') as f:
-            f.write("test")
+        Path(self.test_file).touch()
         
         result_path = self.file_manager.handle_file_conflict(self.test_file, "overwrite")
         
@@ -83,39 +84,49 @@ class TestFileManager(unittest.TestCase):
     def test_handle_file_conflict_backup(self):
         """测试备份策略"""
         # 创建一个已存在的文件
-        with open(self.test_file, 'w') as f:
-            f.write("test")
+        Path(self.test_file).touch()
         
         result_path = self.file_manager.handle_file_conflict(self.test_file, "backup")
         
         self.assertEqual(result_path, self.test_file)
         
         # 检查是否创建了备份文件
-        backup_files = [f for f in os.listdir(self.temp_dir) if "backup" in f]
-        self.assertTrue(len(backup_files) > 0)
+        with os.scandir(self.temp_dir) as entries:
+            self.assertTrue(any("backup" in entry.name for entry in entries))
     
     def test_generate_unique_filename_multiple_conflicts(self):
         """测试多个文件冲突的情况"""
-        base_file = os.path.join(self.temp_dir, "report.xlsx")
+        base_file = self._p + "report.xlsx"
         
         # 创建多个冲突文件
         for i in range(3):
             if i == 0:
                 conflict_file = base_file
             else:
-                conflict_file = os.path.join(self.temp_dir, f"report_{i}.xlsx")
+                conflict_file = self._p + f"report_{i}.xlsx"
             
-            with open(conflict_file, 'w') as f:
-                f.write(f"test{i}")
+            Path(conflict_file).touch()
         
         result_path = self.file_manager._generate_unique_filename(base_file)
         
         self.assertTrue(result_path.endswith("_3.xlsx"))
         self.assertFalse(os.path.exists(result_path))
+
+    def test_generate_unique_filename_many_conflicts(self):
+        """测试大量连续冲突时返回第一个空闲序号"""
+        base_file = self._p + "report.xlsx"
+        Path(base_file).touch()
+        for i in range(1, 21):
+            Path(self._p + f"report_{i}.xlsx").touch()
+
+        result_path = self.file_manager._generate_unique_filename(base_file)
+
+        self.assertTrue(result_path.endswith("report_21.xlsx"))
+        self.assertFalse(os.path.exists(result_path))
     
     def test_validate_save_path_valid(self):
         """测试有效路径验证"""
-        valid_path = os.path.join(self.temp_dir, "valid_report.xlsx")
+        valid_path = self._p + "valid_report.xlsx"
         
         is_valid, error_msg = self.file_manager.validate_save_path(valid_path)
         
@@ -124,7 +135,7 @@ class TestFileManager(unittest.TestCase):
     
     def test_validate_save_path_create_directory(self):
         """测试创建不存在的目录"""
-        new_dir = os.path.join(self.temp_dir, "new_subdir")
+        new_dir = self._p + "new_subdir"
         valid_path = os.path.join(new_dir, "report.xlsx")
         
         is_valid, error_msg = self.file_manager.validate_save_path(valid_path)
@@ -134,7 +145,7 @@ class TestFileManager(unittest.TestCase):
     
     def test_validate_save_path_invalid_filename(self):
         """测试无效文件名"""
-        invalid_path = os.path.join(self.temp_dir, "report<>.xlsx")
+        invalid_path = self._p + "report<>.xlsx"
         
         is_valid, error_msg = self.file_manager.validate_save_path(invalid_path)
         
@@ -170,8 +181,7 @@ class TestFileManager(unittest.TestCase):
     def test_get_file_info_existing_file(self):
         """测试获取已存在文件的信息"""
         # 创建测试文件
-        with open(self.test_file, 'w') as f:
-            f.write("test content")
+        Path(self.test_file).touch()
         
         info = self.file_manager.get_file_info(self.test_file)
         
@@ -183,7 +193,7 @@ class TestFileManager(unittest.TestCase):
     
     def test_get_file_info_non_existing_file(self):
         """测试获取不存在文件的信息"""
-        non_existing_file = os.path.join(self.temp_dir, "non_existing.xlsx")
+        non_existing_file = self._p + "non_existing.xlsx"
         
         info = self.file_manager.get_file_info(non_existing_file)
         
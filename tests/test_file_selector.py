@@ -2,28 +2,44 @@
 文件选择器测试
 """
 import unittest
-import tempfile
 import os
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import tkinter  # noqa: F401
+except ImportError:
+    # 无Tk支持的环境下使用替身模块，对话框调用均由 patch 模拟
+    _tk_stub = MagicMock()
+    sys.modules['tkinter'] = _tk_stub
+    sys.modules['tkinter.filedialog'] = _tk_stub.filedialog
+    sys.modules['tkinter.messagebox'] = _tk_stub.messagebox
+
 from ui.file_selector import FileSelector
+from tmp_support import TempDirTestCase
 
 
-class TestFileSelector(unittest.TestCase):
+class TestFileSelector(TempDirTestCase):
     """文件选择器测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的被测对象"""
+        super().setUpClass()
+        # FileSelector 不保存测试间可见的状态，所有测试共用一个实例
+        cls.file_selector = FileSelector()
+    
     def setUp(self):
         """测试前设置"""
-        self.file_selector = FileSelector()
-        
-        # 创建临时测试文件
-        self.temp_dir = tempfile.mkdtemp()
-        self.valid_excel_file = os.path.join(self.temp_dir, "test.xlsx")
-        self.invalid_file = os.path.join(self.temp_dir, "test.txt")
+        super().setUp()
+        # 临时目录是不带结尾分隔符的绝对路径，直接拼接文件名即可
+        self._p = self.temp_dir + os.sep
+        self.valid_excel_file = self._p + "test.xlsx"
+        self.invalid_file = self._p + "test.txt"
         
         # 创建测试文件
         with open(self.valid_excel_file, 'wb') as f:
@@ -33,12 +49,6 @@ class TestFileSelector(unittest.TestCase):
         with open(self.invalid_file, 'w') as f:
             f.write("test content")
     
-    def tearDown(self):
-        """测试后清理"""
-        # 清理临时文件
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_initialization(self):
         """测试初始化"""
         file_selector = FileSelector()
@@ -130,7 +140,7 @@ class TestFileSelector(unittest.TestCase):
     @patch('tkinter.filedialog.asksaveasfilename')
     def test_select_output_file(self, mock_dialog):
         """测试选择输出文件"""
-        output_path = os.path.join(self.temp_dir, "output.xlsx")
+        output_path = self._p + "output.xlsx"
         mock_dialog.return_value = output_path
         
         result = self.file_selector.select_output_file()
@@ -143,15 +153,15 @@ class TestFileSelector(unittest.TestCase):
     
     def test_validate_large_file(self):
         """测试验证大文件"""
-        # 创建一个大文件用于测试
-        large_file = os.path.join(self.temp_dir, "large.xlsx")
-        with open(large_file, 'wb') as f:
-            # 写入超过100MB的数据
-            f.write(b'0' * (101 * 1024 * 1024))
+        # 创建空文件，并模拟其大小超过100MB
+        large_file = self._p + "large.xlsx"
+        Path(large_file).touch()
         
-        with patch('tkinter.messagebox.showerror'):
+        with patch('os.path.getsize', return_value=101 * 1024 * 1024), \
+                patch('tkinter.messagebox.showerror') as mock_error:
             result = self.file_selector.validate_file_path(large_file)
             self.assertFalse(result)
+            self.assertIn("文件过大", mock_error.call_args[0][1])
 
 
 if __name__ == '__main__':
@@ -3,77 +3,103 @@
 """
 import logging
 import os
-import tempfile
 import unittest
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable
 from unittest.mock import patch, MagicMock
 import time
 
-from utils.logger import ApplicationLogger, LoggerError, ColoredFormatter, get_logger, log_info, log_error, log_warning
+from utils.logger import (ApplicationLogger, LoggerError, ColoredFormatter, get_logger, log_info, log_error,
+                          log_warning, _parse_size, _get_formatter)
+from tmp_support import TempDirTestCase
 
 
-class TestApplicationLogger(unittest.TestCase):
+def _read_log(app_logger: ApplicationLogger, log_file: Path) -> str:
+    """
+    刷新日志处理器后一次性读取日志文件内容
+    
+    Args:
+        app_logger: 写入该文件的日志管理器
+        log_file: 日志文件路径
+        
+    Returns:
+        日志文件内容
+    """
+    for handler in app_logger.logger.handlers:
+        handler.flush()
+    return log_file.read_text(encoding='utf-8')
+
+
+def _patch_config_loader(logging_config: Dict[str, Any]):
+    """
+    用返回固定日志配置的替身替换 utils.logger 中的 ConfigLoader
+    
+    Args:
+        logging_config: get_logging_config() 返回的配置
+        
+    Returns:
+        已启动的 patcher，调用方负责 stop()
+    """
+    patcher = patch('utils.logger.ConfigLoader')
+    mock_loader = patcher.start()
+    mock_loader.return_value.get_logging_config.return_value = logging_config
+    return patcher
+
+
+def _assert_all_in(test_case: unittest.TestCase, needles: Iterable[str], haystack: str) -> None:
+    """
+    断言全部子串都出现在文本中，失败时一次列出所有缺失的子串
+    
+    Args:
+        test_case: 当前测试用例
+        needles: 要查找的子串序列
+        haystack: 被查找的文本
+    """
+    missing = [needle for needle in needles if needle not in haystack]
+    test_case.assertFalse(missing, msg=f"缺失内容: {missing}")
+
+
+class TestApplicationLogger(TempDirTestCase):
     """应用程序日志器测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """让未传入配置的日志器使用临时目录中的日志文件，不读取磁盘上的配置文件"""
+        super().setUpClass()
+        cls._config_patcher = _patch_config_loader({
+            "level": "DEBUG",
+            "log_file": os.path.join(cls._root, "default.log"),
+            "max_file_size": "1MB",
+            "backup_count": 3,
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        })
+    
+    @classmethod
+    def tearDownClass(cls):
+        """停止配置替身"""
+        cls._config_patcher.stop()
+        super().tearDownClass()
+    
     def setUp(self):
         """测试前准备"""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
+        # 关闭本测试创建的单例日志器，释放日志文件
+        self.addCleanup(ApplicationLogger._reset_all)
         self.log_file = Path(self.temp_dir) / "test.log"
         
         # 清除单例实例
         ApplicationLogger._instances.clear()
         
-        self.test_config = {
+        # 只读的基础配置，测试需要改动的配置项用 ChainMap 覆盖，不复制字典
+        self.test_config = MappingProxyType({
             "level": "DEBUG",
             "log_file": str(self.log_file),
             "max_file_size": "1MB",
             "backup_count": 3,
             "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        }
-    
-    def tearDown(self):
-        """测试后清理"""
-        # 关闭所有日志处理器
-        for instance in ApplicationLogger._instances.values():
-            if instance.logger:
-                for handler in instance.logger.handlers[:]:
-                    handler.close()
-                    instance.logger.removeHandler(handler)
-        
-        # 清除单例实例
-        ApplicationLogger._instances.clear()
-        
-        # 清理日志文件
-        try:
-            if self.log_file.exists():
-                self.log_file.unlink()
-        except PermissionError:
-            pass  # 忽略权限错误
-        
-        # 清理备份文件
-        for i in range(1, 6):
-            backup_file = Path(f"{self.log_file}.{i}")
-            try:
-                if backup_file.exists():
-                    backup_file.unlink()
-            except PermissionError:
-                pass  # 忽略权限错误
-        
-        # 清理目录
-        try:
-            # 清理可能剩余的文件
-            for file in Path(self.temp_dir).iterdir():
-                try:
-                    if file.is_file():
-                        file.unlink()
-                    elif file.is_dir():
-                        import shutil
-                        shutil.rmtree(file)
-                except PermissionError:
-                    pass
-            os.rmdir(self.temp_dir)
-        except (OSError, PermissionError):
-            pass  # 忽略清理错误
+        })
     
     def test_logger_initialization(self):
         """测试日志器初始化"""
@@ -94,6 +120,26 @@ class TestApplicationLogger(unittest.TestCase):
         logger3 = ApplicationLogger.get_logger("different_name", self.test_config)
         self.assertIsNot(logger1, logger3)
     
+    def test_singleton_per_process(self):
+        """测试单例按进程区分，子进程不复用父进程的实例"""
+        parent_logger = ApplicationLogger.get_logger("test_per_process", self.test_config)
+        
+        with patch('utils.logger.os.getpid', return_value=os.getpid() + 1):
+            child_logger = ApplicationLogger.get_logger("test_per_process", self.test_config)
+        
+        self.assertIsNot(parent_logger, child_logger)
+        self.assertIs(ApplicationLogger.get_logger("test_per_process"), parent_logger)
+    
+    def test_formatter_shared_between_loggers(self):
+        """测试相同格式的日志器共用同一个格式化器"""
+        logger1 = ApplicationLogger("test_formatter_1", self.test_config)
+        logger2 = ApplicationLogger("test_formatter_2", self.test_config)
+        
+        formatter1 = logger1.logger.handlers[-1].formatter
+        formatter2 = logger2.logger.handlers[-1].formatter
+        self.assertIs(formatter1, formatter2)
+        self.assertIs(formatter1, _get_formatter(self.test_config["format"], '%Y-%m-%d %H:%M:%S'))
+    
     def test_config_loading_fallback(self):
         """测试配置加载失败时的回退机制"""
         with patch('utils.logger.ConfigLoader') as mock_config_loader:
@@ -107,8 +153,7 @@ class TestApplicationLogger(unittest.TestCase):
     
     def test_invalid_log_level(self):
         """测试无效日志级别处理"""
-        invalid_config = self.test_config.copy()
-        invalid_config["level"] = "INVALID_LEVEL"
+        invalid_config = ChainMap({"level": "INVALID_LEVEL"}, self.test_config)
         
         logger = ApplicationLogger("test_invalid_level", invalid_config)
         
@@ -117,7 +162,7 @@ class TestApplicationLogger(unittest.TestCase):
     
     def test_file_size_parsing(self):
         """测试文件大小解析"""
-        logger = ApplicationLogger("test_size", self.test_config)
+        logger = ApplicationLogger("test_file_size_parsing", self.test_config)
         
         # 测试各种格式
         self.assertEqual(logger._parse_size("1024"), 1024)
@@ -126,93 +171,117 @@ class TestApplicationLogger(unittest.TestCase):
         self.assertEqual(logger._parse_size("1GB"), 1024 * 1024 * 1024)
         self.assertEqual(logger._parse_size("1.5MB"), int(1.5 * 1024 * 1024))
         
+        # 数字部分按 float()/int() 的语法解析
+        self.assertEqual(logger._parse_size("-5MB"), -5 * 1024 * 1024)
+        self.assertEqual(logger._parse_size(".5MB"), 512 * 1024)
+        self.assertEqual(logger._parse_size("1e3KB"), 1000 * 1024)
+        self.assertEqual(logger._parse_size("5.MB"), 5 * 1024 * 1024)
+        self.assertEqual(logger._parse_size("1_000"), 1000)
+        self.assertEqual(logger._parse_size(" 10 mb "), 10 * 1024 * 1024)
+        
         # 测试无效格式
         with self.assertRaises(ValueError):
             logger._parse_size("invalid")
+        
+        # 相同输入的解析结果被缓存
+        hits = _parse_size.cache_info().hits
+        logger._parse_size("1MB")
+        self.assertGreater(_parse_size.cache_info().hits, hits)
+        
+        # 缓存区分输入类型，1024.0 不会命中 1024 的缓存结果
+        self.assertEqual(logger._parse_size(1024), 1024)
+        with self.assertRaises(ValueError):
+            logger._parse_size(1024.0)
     
     def test_logging_methods(self):
         """测试各种日志记录方法"""
-        logger = ApplicationLogger("test_methods", self.test_config)
-        
-        # 测试各种级别的日志
-        logger.debug("调试信息")
-        logger.info("一般信息")
-        logger.warning("警告信息")
-        logger.error("错误信息")
-        logger.critical("严重错误")
-        
-        # 验证日志文件存在且有内容
-        self.assertTrue(self.log_file.exists())
-        
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("调试信息", content)
-            self.assertIn("一般信息", content)
-            self.assertIn("警告信息", content)
-            self.assertIn("错误信息", content)
-            self.assertIn("严重错误", content)
+        logger = ApplicationLogger("test_logging_methods", self.test_config)
+        
+        # 测试各种级别的日志（在内存中捕获，不回读日志文件）
+        with self.assertLogs(logger.logger, level='DEBUG') as cm:
+            logger.debug("调试信息")
+            logger.info("一般信息")
+            logger.warning("警告信息")
+            logger.error("错误信息")
+            logger.critical("严重错误")
+        
+        content = "\n".join(cm.output)
+        _assert_all_in(self, (
+            "调试信息",
+            "一般信息",
+            "警告信息",
+            "错误信息",
+            "严重错误",
+        ), content)
     
     def test_exception_logging(self):
         """测试异常日志记录"""
-        logger = ApplicationLogger("test_exception", self.test_config)
+        logger = ApplicationLogger("test_exception_logging", self.test_config)
         
-        try:
-            raise ValueError("测试异常")
-        except ValueError:
-            logger.exception("捕获到异常")
+        with self.assertLogs(logger.logger, level='DEBUG') as cm:
+            try:
+                raise ValueError("测试异常")
+            except ValueError:
+                logger.exception("捕获到异常")
         
         # 验证异常信息被记录
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("捕获到异常", content)
-            self.assertIn("ValueError", content)
-            self.assertIn("测试异常", content)
+        content = "\n".join(cm.output)
+        _assert_all_in(self, (
+            "捕获到异常",
+            "ValueError",
+            "测试异常",
+        ), content)
     
     def test_operation_logging(self):
         """测试操作日志记录"""
-        logger = ApplicationLogger("test_operation", self.test_config)
+        logger = ApplicationLogger("test_operation_logging", self.test_config)
         
-        logger.log_operation("文件读取", {"文件名": "test.xlsx", "大小": "1MB"})
+        with self.assertLogs(logger.logger, level='DEBUG') as cm:
+            logger.log_operation("文件读取", {"文件名": "test.xlsx", "大小": "1MB"})
         
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("操作: 文件读取", content)
-            self.assertIn("文件名=test.xlsx", content)
-            self.assertIn("大小=1MB", content)
+        content = "\n".join(cm.output)
+        _assert_all_in(self, (
+            "操作: 文件读取",
+            "文件名=test.xlsx",
+            "大小=1MB",
+        ), content)
     
     def test_error_with_context_logging(self):
         """测试带上下文的错误日志"""
-        logger = ApplicationLogger("test_error_context", self.test_config)
+        logger = ApplicationLogger("test_error_with_context_logging", self.test_config)
         
         error = ValueError("测试错误")
         context = {"用户": "张三", "操作": "数据处理"}
         
-        logger.log_error_with_context(error, context)
+        with self.assertLogs(logger.logger, level='DEBUG') as cm:
+            logger.log_error_with_context(error, context)
         
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("错误: ValueError: 测试错误", content)
-            self.assertIn("上下文:", content)
-            self.assertIn("用户=张三", content)
-            self.assertIn("操作=数据处理", content)
+        content = "\n".join(cm.output)
+        _assert_all_in(self, (
+            "错误: ValueError: 测试错误",
+            "上下文:",
+            "用户=张三",
+            "操作=数据处理",
+        ), content)
     
     def test_performance_logging(self):
         """测试性能日志记录"""
-        logger = ApplicationLogger("test_performance", self.test_config)
+        logger = ApplicationLogger("test_performance_logging", self.test_config)
         
-        logger.log_performance("数据处理", 1.234, {"记录数": 1000})
+        with self.assertLogs(logger.logger, level='DEBUG') as cm:
+            logger.log_performance("数据处理", 1.234, {"记录数": 1000})
         
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("性能: 数据处理 耗时 1.234秒", content)
-            self.assertIn("记录数=1000", content)
+        content = "\n".join(cm.output)
+        _assert_all_in(self, (
+            "性能: 数据处理 耗时 1.234秒",
+            "记录数=1000",
+        ), content)
     
     def test_log_file_creation(self):
         """测试日志文件创建"""
         # 使用不存在的目录
         nested_log_file = Path(self.temp_dir) / "logs" / "nested" / "test.log"
-        config = self.test_config.copy()
-        config["log_file"] = str(nested_log_file)
+        config = ChainMap({"log_file": str(nested_log_file)}, self.test_config)
         
         logger = ApplicationLogger("test_file_creation", config)
         logger.info("测试消息")
@@ -224,9 +293,10 @@ class TestApplicationLogger(unittest.TestCase):
     def test_file_rotation(self):
         """测试日志文件轮转"""
         # 设置很小的文件大小以触发轮转
-        small_config = self.test_config.copy()
-        small_config["max_file_size"] = "100"  # 100字节
-        small_config["backup_count"] = 2
+        small_config = ChainMap({
+            "max_file_size": "100",  # 100字节
+            "backup_count": 2,
+        }, self.test_config)
         
         logger = ApplicationLogger("test_rotation", small_config)
         
@@ -240,12 +310,12 @@ class TestApplicationLogger(unittest.TestCase):
     
     def test_get_log_info(self):
         """测试获取日志信息"""
-        logger = ApplicationLogger("test_info", self.test_config)
+        logger = ApplicationLogger("test_get_log_info", self.test_config)
         logger.info("测试消息")
         
         info = logger.get_log_info()
         
-        self.assertEqual(info["logger_name"], "test_info")
+        self.assertEqual(info["logger_name"], "test_get_log_info")
         self.assertEqual(info["level"], logging.DEBUG)
         self.assertGreater(info["handlers_count"], 0)
         self.assertIn("config", info)
@@ -260,22 +330,25 @@ class TestApplicationLogger(unittest.TestCase):
         """测试配置重新加载"""
         logger = ApplicationLogger("test_reload", self.test_config)
         original_level = logger.logger.level
+        old_file_handler = logger.logger.handlers[-1]
         
         # 修改配置
-        new_config = self.test_config.copy()
-        new_config["level"] = "ERROR"
+        new_config = ChainMap({"level": "ERROR"}, self.test_config)
         
         logger.reload_config(new_config)
         
         # 验证配置已更新
         self.assertEqual(logger.logger.level, logging.ERROR)
         self.assertNotEqual(logger.logger.level, original_level)
+        
+        # 旧的文件处理器已关闭，不会残留打开的文件句柄
+        self.assertIsNone(old_file_handler.stream)
+        self.assertNotIn(old_file_handler, logger.logger.handlers)
     
     def test_file_handler_error_handling(self):
         """测试文件处理器错误处理"""
         # 使用无效路径
-        invalid_config = self.test_config.copy()
-        invalid_config["log_file"] = "/invalid<>path/test.log"
+        invalid_config = ChainMap({"log_file": "/invalid<>path/test.log"}, self.test_config)
         
         # 应该不抛出异常，而是记录警告
         logger = ApplicationLogger("test_file_error", invalid_config)
@@ -291,29 +364,49 @@ class TestColoredFormatter(unittest.TestCase):
         """测试彩色格式化"""
         formatter = ColoredFormatter("%(levelname)s - %(message)s")
         
-        # 创建不同级别的日志记录
-        record_info = logging.LogRecord(
-            name="test", level=logging.INFO, pathname="", lineno=0,
-            msg="测试信息", args=(), exc_info=None
+        # 各级别对应的颜色代码
+        levels = (
+            (logging.DEBUG, '\033[36m'),     # 青色
+            (logging.INFO, '\033[32m'),      # 绿色
+            (logging.WARNING, '\033[33m'),   # 黄色
+            (logging.ERROR, '\033[31m'),     # 红色
+            (logging.CRITICAL, '\033[35m'),  # 紫色
         )
         
-        formatted = formatter.format(record_info)
-        
-        # 验证包含颜色代码
-        self.assertIn('\033[32m', formatted)  # 绿色
-        self.assertIn('\033[0m', formatted)   # 重置
+        for level, color in levels:
+            with self.subTest(level=logging.getLevelName(level)):
+                record = logging.LogRecord("test", level, "", 0, "测试信息", (), None)
+                formatted = formatter.format(record)
+                
+                self.assertIn(color, formatted)
+                self.assertIn('\033[0m', formatted)  # 重置
 
 
-class TestModuleFunctions(unittest.TestCase):
+class TestModuleFunctions(TempDirTestCase):
     """模块函数测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """让未传入配置的日志器使用临时目录中的日志文件，不读取磁盘上的配置文件"""
+        super().setUpClass()
+        cls._config_patcher = _patch_config_loader({
+            "level": "INFO",
+            "log_file": os.path.join(cls._root, "module.log"),
+            "max_file_size": "1MB",
+            "backup_count": 3
+        })
+    
+    @classmethod
+    def tearDownClass(cls):
+        """停止配置替身"""
+        cls._config_patcher.stop()
+        super().tearDownClass()
+    
     def setUp(self):
         """测试前准备"""
+        super().setUp()
         ApplicationLogger._instances.clear()
-    
-    def tearDown(self):
-        """测试后清理"""
-        ApplicationLogger._instances.clear()
+        self.addCleanup(ApplicationLogger._reset_all)
     
     def test_get_logger_function(self):
         """测试get_logger函数"""
@@ -333,35 +426,16 @@ class TestModuleFunctions(unittest.TestCase):
         mock_logger.warning.assert_called_once_with("测试警告")
 
 
-class TestLoggerIntegration(unittest.TestCase):
+class TestLoggerIntegration(TempDirTestCase):
     """日志系统集成测试"""
     
     def setUp(self):
         """测试前准备"""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
+        self.addCleanup(ApplicationLogger._reset_all)
         self.log_file = Path(self.temp_dir) / "integration.log"
         ApplicationLogger._instances.clear()
     
-    def tearDown(self):
-        """测试后清理"""
-        # 关闭所有日志处理器
-        for instance in ApplicationLogger._instances.values():
-            if instance.logger:
-                for handler in instance.logger.handlers[:]:
-                    handler.close()
-                    instance.logger.removeHandler(handler)
-        
-        # 清除单例实例
-        ApplicationLogger._instances.clear()
-        
-        # 清理日志文件
-        try:
-            if self.log_file.exists():
-                self.log_file.unlink()
-            os.rmdir(self.temp_dir)
-        except (OSError, PermissionError):
-            pass  # 忽略清理错误
-    
     def test_real_world_scenario(self):
         """测试真实世界场景"""
         config = {
@@ -386,21 +460,22 @@ class TestLoggerIntegration(unittest.TestCase):
         except FileNotFoundError as e:
             logger.log_error_with_context(e, {"文件路径": "/path/to/file.xlsx"})
         
-        # 模拟性能监控
-        start_time = time.time()
-        time.sleep(0.01)  # 模拟处理时间
-        duration = time.time() - start_time
+        # 模拟性能监控（使用伪时钟模拟10毫秒的处理时间）
+        with patch('time.time', side_effect=[1000.0, 1000.01]):
+            start_time = time.time()
+            duration = time.time() - start_time
         logger.log_performance("数据处理", duration, {"记录数": 1000})
         
         # 验证日志文件内容
         self.assertTrue(self.log_file.exists())
         
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertIn("应用程序启动", content)
-            self.assertIn("操作: 读取Excel文件", content)
-            self.assertIn("错误: FileNotFoundError", content)
-            self.assertIn("性能: 数据处理", content)
+        content = _read_log(logger, self.log_file)
+        _assert_all_in(self, (
+            "应用程序启动",
+            "操作: 读取Excel文件",
+            "错误: FileNotFoundError",
+            "性能: 数据处理",
+        ), content)
 
 
 if __name__ == '__main__':
@@ -10,12 +10,38 @@ import os
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ui.main_window import MainWindow
+# 主窗口模块（连带日志、配置等模块）在测试类的 setUpClass 中才导入，
+# 只收集或运行其他测试时不必承担这部分导入开销
+MainWindow = None
+
+
+def _import_main_window() -> None:
+    """导入主窗口类并赋给模块级名称 MainWindow"""
+    global MainWindow
+    if MainWindow is None:
+        from ui.main_window import MainWindow
 
 
 class TestMainWindow(unittest.TestCase):
     """主窗口测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共用的隐藏根窗口"""
+        _import_main_window()
+        # Tk根窗口初始化（启动Tcl解释器）开销较大，整个测试类只创建一次，
+        # MainWindow 内部的 tk.Tk() 调用均返回这个共用根窗口
+        cls._root = tk.Tk()
+        cls._root.withdraw()
+        cls._tk_patcher = patch('ui.main_window.tk.Tk', return_value=cls._root)
+        cls._tk_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """销毁共用的根窗口"""
+        cls._tk_patcher.stop()
+        cls._root.destroy()
+    
     def setUp(self):
         """测试前设置"""
         # 创建测试用的主窗口
@@ -23,9 +49,9 @@ class TestMainWindow(unittest.TestCase):
         
     def tearDown(self):
         """测试后清理"""
-        # 销毁窗口
-        if hasattr(self, 'main_window'):
-            self.main_window.destroy()
+        # 只销毁本测试创建的控件，保留共用的根窗口
+        for child in self._root.winfo_children():
+            child.destroy()
     
     def test_window_initialization(self):
         """测试窗口初始化"""
@@ -39,33 +65,20 @@ class TestMainWindow(unittest.TestCase):
         self.assertEqual(self.main_window.position_file_path.get(), "")
         self.assertEqual(self.main_window.interview_file_path.get(), "")
     
-    def test_file_path_setting(self):
-        """测试文件路径设置"""
-        test_position_path = "/test/path/position.xlsx"
-        test_interview_path = "/test/path/interview.xlsx"
-        
-        # 设置文件路径
-        self.main_window.set_position_file_path(test_position_path)
-        self.main_window.set_interview_file_path(test_interview_path)
-        
-        # 验证路径是否正确设置
-        self.assertEqual(self.main_window.position_file_path.get(), test_position_path)
-        self.assertEqual(self.main_window.interview_file_path.get(), test_interview_path)
-    
     def test_start_button_state(self):
         """测试开始按钮状态控制"""
         # 初始状态应该是禁用的
-        self.assertEqual(str(self.main_window.start_btn['state']), 'disabled')
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
         
         # 设置一个文件路径，按钮仍应禁用
         self.main_window.set_position_file_path("/test/position.xlsx")
         self.main_window._check_ready_to_process()
-        self.assertEqual(str(self.main_window.start_btn['state']), 'disabled')
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
         
         # 设置两个文件路径，按钮应该启用
         self.main_window.set_interview_file_path("/test/interview.xlsx")
         self.main_window._check_ready_to_process()
-        self.assertEqual(str(self.main_window.start_btn['state']), 'normal')
+        self.assertEqual(self.main_window.start_btn_state(), 'normal')
     
     def test_clear_selections(self):
         """测试清空选择功能"""
@@ -80,39 +93,7 @@ class TestMainWindow(unittest.TestCase):
         # 验证路径已清空且按钮被禁用
         self.assertEqual(self.main_window.position_file_path.get(), "")
         self.assertEqual(self.main_window.interview_file_path.get(), "")
-        self.assertEqual(str(self.main_window.start_btn['state']), 'disabled')
-    
-    def test_callback_assignment(self):
-        """测试回调函数赋值"""
-        mock_callback = MagicMock()
-        
-        # 设置回调函数
-        self.main_window.on_position_file_select = mock_callback
-        self.main_window.on_interview_file_select = mock_callback
-        self.main_window.on_start_processing = mock_callback
-        
-        # 验证回调函数已正确设置
-        self.assertEqual(self.main_window.on_position_file_select, mock_callback)
-        self.assertEqual(self.main_window.on_interview_file_select, mock_callback)
-        self.assertEqual(self.main_window.on_start_processing, mock_callback)
-    
-    @patch('tkinter.messagebox.showerror')
-    def test_show_error(self, mock_showerror):
-        """测试错误信息显示"""
-        error_msg = "测试错误信息"
-        self.main_window.show_error(error_msg)
-        
-        # 验证messagebox.showerror被调用
-        mock_showerror.assert_called_once_with("错误", error_msg)
-    
-    @patch('tkinter.messagebox.showinfo')
-    def test_show_info(self, mock_showinfo):
-        """测试信息提示显示"""
-        info_msg = "测试信息"
-        self.main_window.show_info(info_msg)
-        
-        # 验证messagebox.showinfo被调用
-        mock_showinfo.assert_called_once_with("信息", info_msg)
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
     
     def test_status_update(self):
         """测试状态更新功能"""
@@ -125,19 +106,24 @@ class TestMainWindow(unittest.TestCase):
         status_content = self.main_window.status_text.get("1.0", tk.END)
         self.assertIn(test_message, status_content)
     
-    def test_progress_display(self):
-        """测试进度显示功能"""
-        # 测试进度更新
-        self.main_window.show_progress(50, "测试进度")
-        
-        # 验证进度条值
-        self.assertEqual(self.main_window.progress_var.get(), 50)
-        self.assertEqual(self.main_window.progress_label['text'], "50%")
-        
-        # 测试进度重置
-        self.main_window.reset_progress()
-        self.assertEqual(self.main_window.progress_var.get(), 0)
-        self.assertEqual(self.main_window.progress_label['text'], "0%")
+    def test_progress_and_clear(self):
+        """测试进度显示及清空状态功能"""
+        with self.subTest(stage='show'):
+            self.main_window._update_status("测试信息")
+            self.main_window.show_progress(50, "测试进度")
+            
+            # 验证进度条值
+            self.assertEqual(self.main_window.progress_var.get(), 50)
+            self.assertEqual(self.main_window.progress_label['text'], "50%")
+        
+        with self.subTest(stage='clear'):
+            # 清空状态时同时重置进度
+            self.main_window.clear_status()
+            
+            status_content = self.main_window.status_text.get("1.0", tk.END).strip()
+            self.assertEqual(status_content, "")
+            self.assertEqual(self.main_window.progress_var.get(), 0)
+            self.assertEqual(self.main_window.progress_label['text'], "0%")
     
     def test_results_display(self):
         """测试结果显示功能"""
@@ -163,27 +149,103 @@ class TestMainWindow(unittest.TestCase):
         """测试处理状态设置"""
         # 测试设置为处理中状态
         self.main_window.set_processing_state(True)
-        self.assertEqual(str(self.main_window.start_btn['state']), 'disabled')
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
         self.assertEqual(self.main_window.start_btn['text'], '处理中...')
         
         # 测试设置为非处理状态
         self.main_window.set_processing_state(False)
-        self.assertEqual(str(self.main_window.start_btn['state']), 'normal')
+        self.assertEqual(self.main_window.start_btn_state(), 'normal')
         self.assertEqual(self.main_window.start_btn['text'], '开始处理')
+
+
+class _FakeStringVar:
+    """不依赖Tcl解释器的 StringVar 替身"""
+    
+    def __init__(self, value: str = ""):
+        self._value = value
+    
+    def get(self) -> str:
+        return self._value
     
-    def test_clear_status(self):
-        """测试清空状态功能"""
-        # 先添加一些状态信息
-        self.main_window._update_status("测试信息")
-        self.main_window.show_progress(50)
+    def set(self, value: str) -> None:
+        self._value = value
+
+
+class TestMainWindowLogic(unittest.TestCase):
+    """主窗口纯逻辑测试类，不创建Tk根窗口和界面控件"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """导入主窗口类"""
+        _import_main_window()
+    
+    def setUp(self):
+        """测试前设置"""
+        # 跳过界面控件创建，只初始化状态变量和回调
+        with patch('ui.main_window.tk.Tk'), \
+                patch('ui.main_window.tk.StringVar', _FakeStringVar), \
+                patch.object(MainWindow, 'setup_ui'):
+            self.main_window = MainWindow()
+        
+        # 状态显示区域使用替身控件
+        self.main_window.status_text = MagicMock()
+    
+    def test_file_path_setting(self):
+        """测试文件路径设置"""
+        test_position_path = "/test/path/position.xlsx"
+        test_interview_path = "/test/path/interview.xlsx"
+        
+        # 设置文件路径
+        self.main_window.set_position_file_path(test_position_path)
+        self.main_window.set_interview_file_path(test_interview_path)
+        
+        # 验证路径是否正确设置
+        self.assertEqual(self.main_window.position_file_path.get(), test_position_path)
+        self.assertEqual(self.main_window.interview_file_path.get(), test_interview_path)
+    
+    def test_callback_assignment(self):
+        """测试回调函数赋值"""
+        mock_callback = MagicMock()
+        
+        # 设置回调函数
+        self.main_window.on_position_file_select = mock_callback
+        self.main_window.on_interview_file_select = mock_callback
+        self.main_window.on_start_processing = mock_callback
+        
+        # 验证回调函数已正确设置
+        self.assertEqual(self.main_window.on_position_file_select, mock_callback)
+        self.assertEqual(self.main_window.on_interview_file_select, mock_callback)
+        self.assertEqual(self.main_window.on_start_processing, mock_callback)
+    
+    def test_start_btn_state_tracking(self):
+        """测试开始按钮状态随处理状态同步记录"""
+        self.main_window.start_btn = MagicMock()
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
         
-        # 清空状态
-        self.main_window.clear_status()
+        self.main_window.set_processing_state(False)
+        self.assertEqual(self.main_window.start_btn_state(), 'normal')
+        self.main_window.start_btn.configure.assert_called_with(state='normal', text="开始处理")
         
-        # 验证状态已清空
-        status_content = self.main_window.status_text.get("1.0", tk.END).strip()
-        self.assertEqual(status_content, "")
-        self.assertEqual(self.main_window.progress_var.get(), 0)
+        self.main_window.set_processing_state(True)
+        self.assertEqual(self.main_window.start_btn_state(), 'disabled')
+    
+    @patch('tkinter.messagebox.showerror')
+    def test_show_error(self, mock_showerror):
+        """测试错误信息显示"""
+        error_msg = "测试错误信息"
+        self.main_window.show_error(error_msg)
+        
+        # 验证messagebox.showerror被调用
+        mock_showerror.assert_called_once_with("错误", error_msg)
+    
+    @patch('tkinter.messagebox.showinfo')
+    def test_show_info(self, mock_showinfo):
+        """测试信息提示显示"""
+        info_msg = "测试信息"
+        self.main_window.show_info(info_msg)
+        
+        # 验证messagebox.showinfo被调用
+        mock_showinfo.assert_called_once_with("信息", info_msg)
 
 
 if __name__ == '__main__':
@@ -3,7 +3,6 @@ ProcessingEngine输入验证和预处理测试
 测试增强的验证和预处理功能
 """
 import unittest
-import tempfile
 import os
 import pandas as pd
 from unittest.mock import Mock, patch
@@ -12,44 +11,58 @@ import sys
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.processing_engine import ProcessingEngine, ProcessingEngineError
+from services.processing_engine import ProcessingEngine, ProcessingEngineError, Indel, _normalize_text
+from tmp_support import TempDirTestCase
+from xlsx_support import write_minimal_xlsx
+from result_support import make_results
 
 
-class TestProcessingEngineValidation(unittest.TestCase):
+class TestProcessingEngineValidation(TempDirTestCase):
     """ProcessingEngine输入验证测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的有效输入文件"""
+        super().setUpClass()
+        
+        # 有效输入文件只读不改，整个测试类只写一次
+        cls.valid_position_file = os.path.join(cls._root, "valid_positions.xlsx")
+        cls.valid_interview_file = os.path.join(cls._root, "valid_interviews.xlsx")
+        cls._create_valid_test_files()
+        # 引擎不保存测试间需要隔离的配置，整个测试类共用一个实例，每个测试前重置处理状态
+        cls._engine = ProcessingEngine()
+    
     def setUp(self):
         """测试前准备"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.engine = ProcessingEngine()
-        
-        # 创建基础测试文件
-        self.valid_position_file = os.path.join(self.temp_dir, "valid_positions.xlsx")
-        self.valid_interview_file = os.path.join(self.temp_dir, "valid_interviews.xlsx")
-        self._create_valid_test_files()
+        super().setUp()
+        self.engine = self._engine
+        self.engine.reset_processing_state()
     
-    def tearDown(self):
-        """测试后清理"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def _assert_error_contains(self, fragment: str) -> None:
+        """
+        断言引擎记录的错误信息中有一条包含指定片段
+        
+        错误信息按行拼接后只做一次子串查找，失败时列出全部错误信息
+        
+        Args:
+            fragment: 要查找的错误信息片段
+        """
+        self.assertIn(fragment, '\n'.join(self.engine._processing_errors))
     
-    def _create_valid_test_files(self):
+    @classmethod
+    def _create_valid_test_files(cls):
         """创建有效的测试文件"""
         # 创建有效的职位表
-        position_data = pd.DataFrame({
-            '岗位代码': ['P001', 'P002'],
-            '岗位名称': ['软件工程师', '产品经理'],
-            '部门': ['技术部', '产品部']
-        })
-        position_data.to_excel(self.valid_position_file, index=False)
+        write_minimal_xlsx(cls.valid_position_file, ['岗位代码', '岗位名称', '部门'], [
+            ['P001', '软件工程师', '技术部'],
+            ['P002', '产品经理', '产品部'],
+        ])
         
         # 创建有效的面试名单
-        interview_data = pd.DataFrame({
-            '姓名': ['张三', '李四'],
-            '岗位名称': ['软件工程师', '产品经理'],
-            '分数': [85.5, 92.0]
-        })
-        interview_data.to_excel(self.valid_interview_file, index=False)
+        write_minimal_xlsx(cls.valid_interview_file, ['姓名', '岗位名称', '分数'], [
+            ['张三', '软件工程师', 85.5],
+            ['李四', '产品经理', 92.0],
+        ])
     
     def test_pre_validate_file_paths_success(self):
         """测试成功的文件路径预验证"""
@@ -78,7 +91,7 @@ class TestProcessingEngineValidation(unittest.TestCase):
             self.valid_position_file
         )
         self.assertFalse(result)
-        self.assertTrue(any("不能是同一个文件" in error for error in self.engine._processing_errors))
+        self._assert_error_contains("不能是同一个文件")
     
     def test_validate_position_file_success(self):
         """测试成功的职位表文件验证"""
@@ -90,20 +103,16 @@ class TestProcessingEngineValidation(unittest.TestCase):
         nonexistent_file = os.path.join(self.temp_dir, "nonexistent.xlsx")
         result = self.engine._validate_position_file(nonexistent_file)
         self.assertFalse(result)
-        self.assertTrue(any("验证失败" in error for error in self.engine._processing_errors))
+        self._assert_error_contains("验证失败")
     
     def test_validate_position_file_no_position_columns(self):
         """测试没有职位相关列的文件"""
         invalid_file = os.path.join(self.temp_dir, "invalid_positions.xlsx")
-        invalid_data = pd.DataFrame({
-            '姓名': ['张三', '李四'],
-            '年龄': [25, 30]
-        })
-        invalid_data.to_excel(invalid_file, index=False)
+        write_minimal_xlsx(invalid_file, ['姓名', '年龄'], [['张三', 25], ['李四', 30]])
         
         result = self.engine._validate_position_file(invalid_file)
         self.assertFalse(result)
-        self.assertTrue(any("没有包含有效职位数据的工作表" in error for error in self.engine._processing_errors))
+        self._assert_error_contains("没有包含有效职位数据的工作表")
     
     def test_validate_interview_file_success(self):
         """测试成功的面试名单文件验证"""
@@ -113,25 +122,21 @@ class TestProcessingEngineValidation(unittest.TestCase):
     def test_validate_interview_file_missing_columns(self):
         """测试缺少必需列的面试名单文件"""
         invalid_file = os.path.join(self.temp_dir, "invalid_interviews.xlsx")
-        invalid_data = pd.DataFrame({
-            '姓名': ['张三', '李四'],
-            '年龄': [25, 30]  # 缺少岗位和分数列
-        })
-        invalid_data.to_excel(invalid_file, index=False)
+        # 缺少岗位和分数列
+        write_minimal_xlsx(invalid_file, ['姓名', '年龄'], [['张三', 25], ['李四', 30]])
         
         result = self.engine._validate_interview_file(invalid_file)
         self.assertFalse(result)
-        self.assertTrue(any("缺少必需的列类型" in error for error in self.engine._processing_errors))
+        self._assert_error_contains("缺少必需的列类型")
     
     def test_validate_interview_file_empty_data(self):
         """测试空数据的面试名单文件"""
         empty_file = os.path.join(self.temp_dir, "empty_interviews.xlsx")
-        empty_data = pd.DataFrame(columns=['姓名', '岗位名称', '分数'])
-        empty_data.to_excel(empty_file, index=False)
+        write_minimal_xlsx(empty_file, ['姓名', '岗位名称', '分数'], [])
         
         result = self.engine._validate_interview_file(empty_file)
         self.assertFalse(result)
-        self.assertTrue(any("没有数据" in error for error in self.engine._processing_errors))
+        self._assert_error_contains("没有数据")
     
     def test_validate_file_compatibility_success(self):
         """测试成功的文件兼容性验证"""
@@ -141,16 +146,30 @@ class TestProcessingEngineValidation(unittest.TestCase):
         )
         self.assertTrue(result)
     
+    def test_validate_file_compatibility_exact_matches_skip_similarity(self):
+        """测试岗位名称全部精确匹配时不再计算相似度"""
+        position_file = os.path.join(self.temp_dir, "positions.xlsx")
+        write_minimal_xlsx(position_file, ['岗位名称', '部门'], [
+            ['软件工程师', '技术部'],
+            ['产品经理', '产品部'],
+        ])
+        
+        with patch.object(self.engine, '_calculate_similarity',
+                          wraps=self.engine._calculate_similarity) as mock_similarity:
+            result = self.engine._validate_file_compatibility(position_file, self.valid_interview_file)
+        
+        self.assertTrue(result)
+        mock_similarity.assert_not_called()
+        self.assertEqual(self.engine._processing_warnings, [])
+    
     def test_validate_file_compatibility_no_matches(self):
         """测试完全不匹配的文件兼容性"""
         # 创建完全不匹配的面试文件
         mismatched_file = os.path.join(self.temp_dir, "mismatched_interviews.xlsx")
-        mismatched_data = pd.DataFrame({
-            '姓名': ['张三', '李四'],
-            '岗位名称': ['销售经理', '市场专员'],  # 完全不匹配
-            '分数': [85.5, 92.0]
-        })
-        mismatched_data.to_excel(mismatched_file, index=False)
+        write_minimal_xlsx(mismatched_file, ['姓名', '岗位名称', '分数'], [
+            ['张三', '销售经理', 85.5],  # 岗位名称完全不匹配
+            ['李四', '市场专员', 92.0],
+        ])
         
         result = self.engine._validate_file_compatibility(
             self.valid_position_file, 
@@ -173,58 +192,98 @@ class TestProcessingEngineValidation(unittest.TestCase):
         similarity = self.engine._calculate_similarity("软件工程师", "销售经理")
         self.assertLess(similarity, 0.5)
 
+    def test_calculate_similarity_ratio(self):
+        """测试默认使用difflib的SequenceMatcher计算相似度"""
+        pairs = [
+            ("软件工程师", "软件工程师"),
+            ("软件工程师", "高级软件工程师"),
+            ("软件工程师", "销售经理"),
+        ]
+        expected = [1.0, 10 / 12, 0.0]
+        
+        for (str1, str2), similarity in zip(pairs, expected):
+            with self.subTest(pair=(str1, str2)):
+                self.assertAlmostEqual(self.engine._calculate_similarity(str1, str2), similarity)
+    
+    @unittest.skipIf(Indel is None, "未安装rapidfuzz")
+    def test_rapidfuzz_similarity_same_decisions(self):
+        """测试启用rapidfuzz时测试数据中岗位名称的模糊匹配判断与默认实现一致"""
+        fast_engine = ProcessingEngine(use_rapidfuzz=True)
+        names = ['软件工程师', '高级软件工程师', '前端开发工程师', '测试工程师', '产品经理', '销售经理',
+                 '数据分析师', '业务分析师', '市场专员', '技术岗位', '业务岗位', '未知岗位', '文秘']
+        
+        for str1 in names:
+            for str2 in names:
+                with self.subTest(pair=(str1, str2)):
+                    self.assertEqual(fast_engine._calculate_similarity(str1, str2) > 0.6,
+                                     self.engine._calculate_similarity(str1, str2) > 0.6)
+    
+    def test_use_rapidfuzz_requires_rapidfuzz(self):
+        """测试未安装rapidfuzz时不能启用rapidfuzz相似度计算"""
+        with patch('services.processing_engine.Indel', None):
+            with self.assertRaises(ValueError):
+                ProcessingEngine(use_rapidfuzz=True)
+
 
 class TestProcessingEnginePreprocessing(unittest.TestCase):
     """ProcessingEngine数据预处理测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的处理引擎"""
+        cls._engine = ProcessingEngine()
+    
     def setUp(self):
         """测试前准备"""
-        self.engine = ProcessingEngine()
-    
-    def test_standardize_text_normal(self):
-        """测试正常文本标准化"""
-        result = self.engine._standardize_text("  软件工程师  ")
-        self.assertEqual(result, "软件工程师")
-    
-    def test_standardize_text_with_special_chars(self):
-        """测试包含特殊字符的文本标准化"""
-        result = self.engine._standardize_text("软件@工程师#")
-        self.assertEqual(result, "软件工程师")
-    
-    def test_standardize_text_multiple_spaces(self):
-        """测试多个空格的文本标准化"""
-        result = self.engine._standardize_text("软件   工程师")
-        self.assertEqual(result, "软件 工程师")
-    
-    def test_standardize_text_none_value(self):
-        """测试None值的文本标准化"""
-        result = self.engine._standardize_text(None)
-        self.assertEqual(result, "")
-    
-    def test_standardize_text_nan_string(self):
-        """测试'nan'字符串的文本标准化"""
-        result = self.engine._standardize_text("nan")
-        self.assertEqual(result, "")
-    
-    def test_standardize_score_valid(self):
-        """测试有效分数标准化"""
-        self.assertEqual(self.engine._standardize_score(85.5), 85.5)
-        self.assertEqual(self.engine._standardize_score("92.3"), 92.3)
-        self.assertEqual(self.engine._standardize_score(100), 100.0)
-        self.assertEqual(self.engine._standardize_score(0), 0.0)
-    
-    def test_standardize_score_invalid(self):
-        """测试无效分数标准化"""
-        self.assertIsNone(self.engine._standardize_score(None))
-        self.assertIsNone(self.engine._standardize_score("invalid"))
-        self.assertIsNone(self.engine._standardize_score(-10))
-        self.assertIsNone(self.engine._standardize_score(150))
-        self.assertIsNone(self.engine._standardize_score("nan"))
-    
-    def test_standardize_score_precision(self):
-        """测试分数精度标准化"""
-        result = self.engine._standardize_score(85.123456)
-        self.assertEqual(result, 85.12)
+        self.engine = self._engine
+        self.engine.reset_processing_state()
+    
+    def test_standardize_text(self):
+        """测试文本标准化：去除首尾空白、特殊字符，合并多个空格，空值返回空字符串"""
+        cases = [
+            ("  软件工程师  ", "软件工程师"),
+            ("软件@工程师#", "软件工程师"),
+            ("软件   工程师", "软件 工程师"),
+            (None, ""),
+            ("nan", ""),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(self.engine._standardize_text(text), expected)
+    
+    def test_standardize_score(self):
+        """测试分数标准化：有效分数保留两位小数，无效分数返回None"""
+        cases = [
+            (85.5, 85.5),
+            ("92.3", 92.3),
+            (100, 100.0),
+            (0, 0.0),
+            (85.123456, 85.12),
+            (None, None),
+            ("invalid", None),
+            (-10, None),
+            (150, None),
+            ("nan", None),
+        ]
+        for score, expected in cases:
+            with self.subTest(score=score):
+                self.assertEqual(self.engine._standardize_score(score), expected)
+    
+    def test_group_interview_scores_sorted_desc(self):
+        """测试面试分数按岗位分组并降序排列，无效分数排在末尾"""
+        interview_data = [
+            {'name': '张三', 'position_name': '软件工程师', 'score': 78.0},
+            {'name': '李四', 'position_name': '软件工程师', 'score': 'invalid'},
+            {'name': '王五', 'position_name': '软件工程师', 'score': '92.5'},
+            {'name': '赵六', 'position_name': '产品经理', 'score': 88.0}
+        ]
+        
+        result = self.engine._group_interview_scores(interview_data)
+        
+        self.assertEqual(set(result), {'软件工程师', '产品经理'})
+        self.assertEqual(result['软件工程师'][:2].tolist(), [92.5, 78.0])
+        self.assertTrue(pd.isna(result['软件工程师'][2]))
+        self.assertEqual(result['产品经理'].tolist(), [88.0])
     
     def test_preprocess_position_data(self):
         """测试职位数据预处理"""
@@ -295,38 +354,52 @@ class TestProcessingEnginePreprocessing(unittest.TestCase):
         self.assertEqual(result[0]['score'], 90.0)
         self.assertGreater(len(self.engine._processing_warnings), 0)  # 应该有重复和无效数据警告
 
+    def test_preprocess_standardizes_repeated_values_once(self):
+        """测试预处理时重复出现的文本只标准化一次"""
+        raw_data = [
+            {'position_code': 'P001', 'position_name': '软件@工程师', 'department': '技术部'}
+            for _ in range(50)
+        ]
+
+        _normalize_text.cache_clear()
+        result = self.engine._preprocess_position_data(raw_data)
+
+        self.assertEqual(len(result), 50)
+        self.assertTrue(all(p['position_name'] == '软件工程师' for p in result))
+        self.assertEqual(_normalize_text.cache_info().misses, 3)
+
+    def test_process_files_clears_text_cache(self):
+        """测试处理结束后（包括处理失败）清空文本标准化缓存"""
+        def fill_cache_and_fail(position_file, interview_file):
+            self.engine._standardize_text('软件工程师')
+            return False
+
+        with patch.object(self.engine, 'validate_input_files', side_effect=fill_cache_and_fail):
+            result = self.engine.process_files('positions.xlsx', 'interviews.xlsx')
+
+        self.assertFalse(result.success)
+        self.assertEqual(_normalize_text.cache_info().currsize, 0)
+
 
 class TestProcessingEngineResultValidation(unittest.TestCase):
     """ProcessingEngine结果验证测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的处理引擎"""
+        cls._engine = ProcessingEngine()
+    
     def setUp(self):
         """测试前准备"""
-        self.engine = ProcessingEngine()
+        self.engine = self._engine
+        self.engine.reset_processing_state()
     
     def test_validate_processing_results_success(self):
         """测试成功的结果验证"""
-        from models.data_models import PositionScoreResult
-        
-        results = [
-            PositionScoreResult(
-                position_code='P001',
-                position_name='软件工程师',
-                department='技术部',
-                min_score=85.5,
-                candidate_count=2,
-                status='正常',
-                notes='匹配成功'
-            ),
-            PositionScoreResult(
-                position_code='P002',
-                position_name='产品经理',
-                department='产品部',
-                min_score=92.0,
-                candidate_count=1,
-                status='正常',
-                notes='匹配成功'
-            )
-        ]
+        results = make_results([
+            ('P001', '软件工程师', '技术部', 85.5, 2, '正常', '匹配成功'),
+            ('P002', '产品经理', '产品部', 92.0, 1, '正常', '匹配成功'),
+        ])
         
         validation_report = self.engine.validate_processing_results(results)
         
@@ -347,28 +420,10 @@ class TestProcessingEngineResultValidation(unittest.TestCase):
     
     def test_validate_processing_results_with_errors(self):
         """测试包含错误的结果验证"""
-        from models.data_models import PositionScoreResult
-        
-        results = [
-            PositionScoreResult(
-                position_code='P001',
-                position_name='',  # 空的职位名称
-                department='技术部',
-                min_score=85.5,
-                candidate_count=-1,  # 无效的候选人数量
-                status='正常',
-                notes='匹配成功'
-            ),
-            PositionScoreResult(
-                position_code='P002',
-                position_name='产品经理',
-                department='产品部',
-                min_score=None,
-                candidate_count=0,
-                status='无法匹配',
-                notes='无法匹配'
-            )
-        ]
+        results = make_results([
+            ('P001', '', '技术部', 85.5, -1, '正常', '匹配成功'),  # 空的职位名称，无效的候选人数量
+            ('P002', '产品经理', '产品部', None, 0, '无法匹配', '无法匹配'),
+        ])
         
         validation_report = self.engine.validate_processing_results(results)
         
@@ -380,37 +435,11 @@ class TestProcessingEngineResultValidation(unittest.TestCase):
     
     def test_validate_processing_results_low_success_rate(self):
         """测试低成功率的结果验证"""
-        from models.data_models import PositionScoreResult
-        
-        results = [
-            PositionScoreResult(
-                position_code='P001',
-                position_name='软件工程师',
-                department='技术部',
-                min_score=85.5,
-                candidate_count=1,
-                status='正常',
-                notes='匹配成功'
-            ),
-            PositionScoreResult(
-                position_code='P002',
-                position_name='产品经理',
-                department='产品部',
-                min_score=None,
-                candidate_count=0,
-                status='无法匹配',
-                notes='无法匹配'
-            ),
-            PositionScoreResult(
-                position_code='P003',
-                position_name='数据分析师',
-                department='数据部',
-                min_score=None,
-                candidate_count=0,
-                status='数据异常',
-                notes='数据异常'
-            )
-        ]
+        results = make_results([
+            ('P001', '软件工程师', '技术部', 85.5, 1, '正常', '匹配成功'),
+            ('P002', '产品经理', '产品部', None, 0, '无法匹配', '无法匹配'),
+            ('P003', '数据分析师', '数据部', None, 0, '数据异常', '数据异常'),
+        ])
         
         validation_report = self.engine.validate_processing_results(results)
         
@@ -2,93 +2,113 @@
 报告生成器测试
 """
 import unittest
-import tempfile
 import os
 from pathlib import Path
 import openpyxl
+from unittest.mock import patch
 
+from services import report_generator
 from services.report_generator import ReportGenerator
-from models.data_models import PositionScoreResult
+from result_support import make_results
+from tmp_support import TempDirTestCase
 
+try:
+    # 回读报告内容时优先使用解析更快的calamine
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
-class TestReportGenerator(unittest.TestCase):
+
+def _load_rows(path: str, max_row: int = 6) -> list:
+    """
+    读取报告开头若干行的单元格值
+    
+    安装了python-calamine时用其解析，否则使用openpyxl只读、仅取值模式；
+    两种方式下空单元格均为None
+    
+    Args:
+        path: 报告文件路径
+        max_row: 读取的最大行数
+        
+    Returns:
+        各行单元格值的元组列表
+    """
+    if CalamineWorkbook is not None:
+        with CalamineWorkbook.from_path(path) as wb:
+            rows = wb.get_sheet_by_index(0).to_python(nrows=max_row)
+        return [tuple(None if value == '' else value for value in row) for row in rows]
+    
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return list(wb.active.iter_rows(min_row=1, max_row=max_row, values_only=True))
+    finally:
+        wb.close()
+
+
+def _write_placeholder(path: str) -> bytes:
+    """
+    在 path 写出一个占位文件，用于触发文件冲突处理
+    
+    Args:
+        path: 占位文件路径
+        
+    Returns:
+        占位文件的内容
+    """
+    content = b"placeholder"
+    with open(path, 'wb') as f:
+        f.write(content)
+    return content
+
+
+class TestReportGenerator(TempDirTestCase):
     """报告生成器测试类"""
     
-    def setUp(self):
-        """测试前准备"""
-        self.generator = ReportGenerator()
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """创建共享的测试数据，并生成一次供只读检查的报告"""
+        super().setUpClass()
+        # ReportGenerator 不保存测试间可见的状态，所有测试共用一个实例
+        cls.generator = ReportGenerator()
         
         # 创建测试数据
-        self.test_results = [
-            PositionScoreResult(
-                position_code="P001",
-                position_name="软件工程师",
-                department="技术部",
-                min_score=85.5,
-                candidate_count=5,
-                status="正常",
-                notes=""
-            ),
-            PositionScoreResult(
-                position_code="P002",
-                position_name="产品经理",
-                department="产品部",
-                min_score=None,
-                candidate_count=0,
-                status="无面试人员",
-                notes="该岗位暂无面试人员"
-            ),
-            PositionScoreResult(
-                position_code="P003",
-                position_name="UI设计师",
-                department="设计部",
-                min_score=78.0,
-                candidate_count=3,
-                status="正常",
-                notes=""
-            )
-        ]
-    
-    def tearDown(self):
-        """测试后清理"""
-        # 清理临时文件
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cls.test_results = make_results([
+            ('P001', '软件工程师', '技术部', 85.5, 5, '正常', ''),
+            ('P002', '产品经理', '产品部', None, 0, '无面试人员', '该岗位暂无面试人员'),
+            ('P003', 'UI设计师', '设计部', 78.0, 3, '正常', ''),
+        ])
+        
+        # 内容、时间戳和样式检查只读取报告，共用同一份生成结果
+        cls._output_path = os.path.join(cls._root, "test_report.xlsx")
+        cls._success, cls._final_path = cls.generator.generate_report(cls.test_results, cls._output_path)
     
     def test_generate_report_success(self):
         """测试成功生成报告"""
-        output_path = os.path.join(self.temp_dir, "test_report.xlsx")
-        
-        success, final_path = self.generator.generate_report(self.test_results, output_path)
-        
-        self.assertTrue(success)
-        self.assertTrue(os.path.exists(final_path))
-        self.assertEqual(final_path, os.path.abspath(output_path))
+        self.assertTrue(self._success)
+        self.assertTrue(os.path.exists(self._final_path))
+        self.assertEqual(self._final_path, os.path.abspath(self._output_path))
         
         # 验证文件可以正常打开
-        wb = openpyxl.load_workbook(final_path)
-        ws = wb.active
+        rows = _load_rows(self._final_path)
         
         # 验证标题
-        self.assertEqual(ws['A1'].value, "岗位最低进面分数汇总报告")
+        self.assertEqual(rows[0][0], "岗位最低进面分数汇总报告")
         
-        # 验证表头
-        expected_headers = ['岗位代码', '岗位名称', '部门', '最低分数', '面试人数', '状态', '备注']
-        for col, expected_header in enumerate(expected_headers, 1):
-            actual_header = ws.cell(row=4, column=col).value
-            self.assertEqual(actual_header, expected_header)
+        # 验证表头（9列布局：面试分数列显示全部分数，不再单独输出最低分数列）
+        expected_headers = ['岗位代码', '岗位名称', '用人司局', '部门名称', '招考人数', '面试人数', '面试分数', '状态', '备注']
+        self.assertEqual(list(rows[3][:len(expected_headers)]), expected_headers)
         
         # 验证数据行
-        self.assertEqual(ws.cell(row=5, column=1).value, "P001")
-        self.assertEqual(ws.cell(row=5, column=2).value, "软件工程师")
-        self.assertEqual(ws.cell(row=5, column=4).value, 85.5)
+        self.assertEqual(rows[4][0], "P001")
+        self.assertEqual(rows[4][1], "软件工程师")
+        self.assertEqual(rows[4][2], "技术部")
+        self.assertEqual(rows[4][5], 5)
+        self.assertEqual(rows[4][7], "正常")
         
         # 验证无数据情况
-        self.assertEqual(ws.cell(row=6, column=4).value, "无数据")
-        self.assertEqual(ws.cell(row=6, column=6).value, "无面试人员")
-        
-        wb.close()
+        self.assertEqual(rows[5][6], "无数据")
+        self.assertEqual(rows[5][7], "无面试人员")
+        self.assertEqual(rows[5][8], "该岗位暂无面试人员")
     
     def test_generate_report_empty_results(self):
         """测试空结果列表"""
@@ -100,14 +120,11 @@ class TestReportGenerator(unittest.TestCase):
         self.assertTrue(os.path.exists(final_path))
         
         # 验证文件结构
-        wb = openpyxl.load_workbook(final_path)
-        ws = wb.active
+        rows = _load_rows(final_path)
         
         # 应该有标题和表头，但没有数据行
-        self.assertEqual(ws['A1'].value, "岗位最低进面分数汇总报告")
-        self.assertIsNotNone(ws.cell(row=4, column=1).value)  # 表头应该存在
-        
-        wb.close()
+        self.assertEqual(rows[0][0], "岗位最低进面分数汇总报告")
+        self.assertIsNotNone(rows[3][0])  # 表头应该存在
     
     def test_generate_report_invalid_path(self):
         """测试无效输出路径"""
@@ -137,69 +154,92 @@ class TestReportGenerator(unittest.TestCase):
     
     def test_report_header_contains_timestamp(self):
         """测试报告包含时间戳"""
-        output_path = os.path.join(self.temp_dir, "timestamp_report.xlsx")
-        
-        success, final_path = self.generator.generate_report(self.test_results, output_path)
-        
-        wb = openpyxl.load_workbook(final_path)
-        ws = wb.active
+        rows = _load_rows(self._final_path, max_row=2)
         
         # 验证时间戳格式
-        time_cell_value = ws['A2'].value
+        time_cell_value = rows[1][0]
         self.assertIsNotNone(time_cell_value)
         self.assertIn("生成时间:", time_cell_value)
-        
-        wb.close()
     
     def test_report_styling_applied(self):
-        """测试报告样式应用"""
-        output_path = os.path.join(self.temp_dir, "styled_report.xlsx")
-        
-        success, final_path = self.generator.generate_report(self.test_results, output_path)
-        
-        wb = openpyxl.load_workbook(final_path)
-        ws = wb.active
-        
-        # 验证标题样式
-        title_cell = ws['A1']
-        self.assertTrue(title_cell.font.bold)
-        self.assertEqual(title_cell.font.size, 16)
-        
-        # 验证表头样式
-        header_cell = ws.cell(row=4, column=1)
-        self.assertTrue(header_cell.font.bold)
-        self.assertEqual(header_cell.font.color.rgb, '00FFFFFF')  # 白色字体
-        
-        wb.close()
+        """测试报告样式应用（xlsxwriter和openpyxl两种写出方式）"""
+        engines = ['openpyxl']
+        if report_generator.xlsxwriter is not None:
+            engines.append('xlsxwriter')
+        
+        for engine in engines:
+            with self.subTest(engine=engine):
+                output_path = os.path.join(self.temp_dir, f"{engine}_report.xlsx")
+                generator = ReportGenerator(writer_engine=engine)
+                _, final_path = generator.generate_report(self.test_results, output_path)
+                
+                # 检查样式需要完整的单元格对象，不能使用只读模式
+                wb = openpyxl.load_workbook(final_path)
+                ws = wb.active
+                
+                # 验证标题样式
+                title_cell = ws['A1']
+                self.assertTrue(title_cell.font.bold)
+                self.assertEqual(title_cell.font.size, 16)
+                
+                # 验证表头样式（两种写出方式的颜色透明度字节不同，只比较RGB部分）
+                header_cell = ws.cell(row=4, column=1)
+                self.assertTrue(header_cell.font.bold)
+                self.assertEqual(header_cell.font.color.rgb[-6:], 'FFFFFF')  # 白色字体
+                self.assertEqual(header_cell.fill.fgColor.rgb[-6:], '366092')
+                
+                wb.close()
+    
+    @unittest.skipIf(report_generator.xlsxwriter is None, "未安装xlsxwriter")
+    def test_xlsxwriter_removes_partial_report_on_error(self):
+        """测试xlsxwriter写出数据行出错时不留下不完整的报告文件"""
+        output_path = os.path.join(self.temp_dir, "partial_report.xlsx")
+        generator = ReportGenerator(writer_engine='xlsxwriter')
+        
+        with patch.object(generator, '_row_values', side_effect=RuntimeError("写出失败")):
+            with self.assertRaises(Exception) as context:
+                generator.generate_report(self.test_results, output_path)
+        
+        self.assertIn("写出失败", str(context.exception))
+        self.assertFalse(os.path.exists(output_path))
+    
+    def test_unsupported_writer_engine(self):
+        """测试不支持的写出引擎在构造时报错"""
+        with self.assertRaises(ValueError):
+            ReportGenerator(writer_engine='xlwt')
+        
+        with patch('services.report_generator.xlsxwriter', None):
+            with self.assertRaises(ValueError):
+                ReportGenerator(writer_engine='xlsxwriter')
     
     def test_generate_report_file_conflict_auto_rename(self):
         """测试文件冲突自动重命名"""
         output_path = os.path.join(self.temp_dir, "conflict_report.xlsx")
         
-        # 先创建一个同名文件
-        with open(output_path, 'w') as f:
-            f.write("existing file")
-        
+        # 已存在同名文件
+        placeholder = _write_placeholder(output_path)
         success, final_path = self.generator.generate_report(self.test_results, output_path, "auto_rename")
         
         self.assertTrue(success)
         self.assertNotEqual(final_path, output_path)
         self.assertTrue(final_path.endswith("_1.xlsx"))
         self.assertTrue(os.path.exists(final_path))
+        # 原文件保持不变
+        self.assertEqual(Path(output_path).read_bytes(), placeholder)
     
     def test_generate_report_file_conflict_overwrite(self):
         """测试文件冲突覆盖"""
         output_path = os.path.join(self.temp_dir, "overwrite_report.xlsx")
         
-        # 先创建一个同名文件
-        with open(output_path, 'w') as f:
-            f.write("existing file")
-        
+        # 已存在同名文件
+        placeholder = _write_placeholder(output_path)
         success, final_path = self.generator.generate_report(self.test_results, output_path, "overwrite")
         
         self.assertTrue(success)
         self.assertEqual(final_path, os.path.abspath(output_path))
-        self.assertTrue(os.path.exists(final_path))
+        # 原文件被报告内容替换
+        self.assertNotEqual(Path(final_path).read_bytes(), placeholder)
+        self.assertEqual(_load_rows(final_path, max_row=1)[0][0], "岗位最低进面分数汇总报告")
     
     def test_get_recommended_save_path(self):
         """测试获取推荐保存路径"""
@@ -0,0 +1,67 @@
+"""
+测试用临时目录辅助函数和测试基类
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+
+def fast_tmp_root() -> str:
+    """
+    获取临时目录的父目录
+
+    Linux下优先使用内存文件系统 /dev/shm，避免测试文件写入磁盘；
+    不可用时回退到系统默认临时目录
+
+    Returns:
+        临时目录的父目录路径
+    """
+    shm = '/dev/shm'
+    if sys.platform.startswith('linux') and os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def make_temp_dir() -> str:
+    """
+    在 fast_tmp_root() 下创建临时目录
+
+    Returns:
+        新建临时目录的路径
+    """
+    return tempfile.mkdtemp(dir=fast_tmp_root())
+
+
+def remove_temp_dir(path: str) -> None:
+    """
+    删除 make_temp_dir() 创建的临时目录及其内容，删除失败的项被跳过，其余内容照常删除
+
+    Args:
+        path: 要删除的目录路径
+    """
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class TempDirTestCase(unittest.TestCase):
+    """
+    带临时目录的测试基类
+
+    每个测试类共用一个临时根目录（类中全部测试结束后删除），
+    每个测试在根目录下使用以测试方法命名的独立子目录 self.temp_dir；
+    子类覆盖 setUpClass/setUp 时需先调用父类方法
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """创建测试类共享的临时根目录"""
+        super().setUpClass()
+        cls._root = make_temp_dir()
+        cls.addClassCleanup(remove_temp_dir, cls._root)
+
+    def setUp(self):
+        """创建本测试的临时子目录"""
+        super().setUp()
+        self.temp_dir = os.path.join(self._root, self._testMethodName)
+        os.mkdir(self.temp_dir)
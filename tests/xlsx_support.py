@@ -0,0 +1,25 @@
+"""
+测试用最小Excel文件生成函数
+"""
+from typing import Any, List, Sequence
+
+import openpyxl
+
+
+def write_minimal_xlsx(path: str, headers: Sequence[str], rows: List[Sequence[Any]]) -> None:
+    """
+    使用openpyxl只写模式生成只含一个工作表的Excel文件
+
+    只写模式按行流式写出，不构建完整的单元格对象，适合批量生成测试输入文件
+
+    Args:
+        path: 输出文件路径
+        headers: 表头
+        rows: 数据行
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(list(headers))
+    for row in rows:
+        ws.append(list(row))
+    wb.save(path)
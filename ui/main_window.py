@@ -45,6 +45,9 @@ class MainWindow:
         # 最近文件列表（最多保存5个）
         self.recent_files: List[str] = []
         
+        # 开始处理按钮的当前状态，与按钮同步维护，读取时无需经过Tcl
+        self._start_btn_state = 'disabled'
+        
         self.setup_ui()
         default_logger.info("主窗口初始化完成")
     
@@ -302,7 +305,7 @@ class MainWindow:
         """清空文件选择"""
         self.position_file_path.set("")
         self.interview_file_path.set("")
-        self.start_btn.configure(state='disabled')
+        self._set_start_btn_state('disabled')
         self.open_file_btn.configure(state='disabled')
         self.open_menu_btn.configure(state='disabled')
         self.last_result_file = None
@@ -620,13 +623,13 @@ class MainWindow:
             
             # 只有配置了列映射才能开始处理
             if self.column_mappings:
-                self.start_btn.configure(state='normal')
+                self._set_start_btn_state('normal')
                 self._update_status("文件选择和列映射配置完成，可以开始处理")
             else:
-                self.start_btn.configure(state='disabled')
+                self._set_start_btn_state('disabled')
                 self._update_status("文件选择完成，请配置列映射关系")
         else:
-            self.start_btn.configure(state='disabled')
+            self._set_start_btn_state('disabled')
             self.config_columns_btn.configure(state='disabled')
             self.select_output_columns_btn.configure(state='disabled')
             self.mapping_status_label.config(text="请先选择两个Excel文件", foreground="gray")
@@ -800,6 +803,26 @@ class MainWindow:
         self.reset_progress()
         default_logger.info("状态显示已清空")
     
+    def _set_start_btn_state(self, state: str, **options):
+        """
+        设置开始处理按钮状态并记录
+        
+        Args:
+            state: 按钮状态，'normal' 或 'disabled'
+            **options: 其他按钮配置项，如 text
+        """
+        self.start_btn.configure(state=state, **options)
+        self._start_btn_state = state
+    
+    def start_btn_state(self) -> str:
+        """
+        获取开始处理按钮的当前状态
+        
+        Returns:
+            按钮状态，'normal' 或 'disabled'
+        """
+        return self._start_btn_state
+    
     def set_processing_state(self, is_processing: bool):
         """
         设置处理状态
@@ -808,10 +831,10 @@ class MainWindow:
             is_processing: 是否正在处理
         """
         if is_processing:
-            self.start_btn.configure(state='disabled', text="处理中...")
+            self._set_start_btn_state('disabled', text="处理中...")
             self._update_status("开始处理，请稍候...")
         else:
-            self.start_btn.configure(state='normal', text="开始处理")
+            self._set_start_btn_state('normal', text="开始处理")
             
         default_logger.info(f"设置处理状态: {is_processing}")
     
@@ -4,8 +4,60 @@
 """
 import json
 import os
+import re
 from typing import Dict, Any, Optional
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，仅用于加速加载，未安装时回退到标准库json
+    orjson = None
+
+# 窗口大小格式：宽x高，如 800x600；宽高两部分按 int() 可接受的十进制写法匹配
+# （允许首尾空白、正号、前导零和数字间下划线），取值须为正数
+_WIN_SIZE_RE = re.compile(r'(\s*\+?\d(?:_?\d)*\s*)x(\s*\+?\d(?:_?\d)*\s*)')
+
+# 允许的日志级别
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+# 默认配置模板，导入时构建一次；各配置节均为只读映射
+_DEFAULTS = MappingProxyType({
+    "app_config": MappingProxyType({
+        "window_title": "Excel岗位分数查询工具",
+        "window_size": "800x600",
+        "default_output_filename": "岗位最低分数汇总.xlsx",
+        "theme": "default",
+        "language": "zh_CN"
+    }),
+    "matching_config": MappingProxyType({
+        "fuzzy_threshold": 0.8,
+        "ignore_case": True,
+        "remove_spaces": True,
+        "enable_fuzzy_matching": True,
+        "max_match_attempts": 3
+    }),
+    "logging_config": MappingProxyType({
+        "level": "INFO",
+        "log_file": "app.log",
+        "max_file_size": "10MB",
+        "backup_count": 5,
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    })
+})
+
+
+def _clone_defaults() -> Dict[str, Any]:
+    """
+    复制默认配置模板为可修改的字典
+
+    默认配置只有两层且叶子均为不可变值，逐节复制即可代替deepcopy
+
+    Returns:
+        默认配置的可修改副本
+    """
+    return {section: dict(values) for section, values in _DEFAULTS.items()}
 
 
 class ConfigValidationError(Exception):
@@ -16,30 +68,8 @@ class ConfigValidationError(Exception):
 class ConfigLoader:
     """配置文件加载器类"""
     
-    # 默认配置
-    DEFAULT_CONFIG = {
-        "app_config": {
-            "window_title": "Excel岗位分数查询工具",
-            "window_size": "800x600",
-            "default_output_filename": "岗位最低分数汇总.xlsx",
-            "theme": "default",
-            "language": "zh_CN"
-        },
-        "matching_config": {
-            "fuzzy_threshold": 0.8,
-            "ignore_case": True,
-            "remove_spaces": True,
-            "enable_fuzzy_matching": True,
-            "max_match_attempts": 3
-        },
-        "logging_config": {
-            "level": "INFO",
-            "log_file": "app.log",
-            "max_file_size": "10MB",
-            "backup_count": 5,
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        }
-    }
+    # 默认配置（只读模板，需要可变副本时调用 _clone_defaults）
+    DEFAULT_CONFIG = _DEFAULTS
     
     # 配置验证规则
     VALIDATION_RULES = {
@@ -66,6 +96,11 @@ class ConfigLoader:
         }
     }
     
+    # 预先展开的验证规则，避免每次验证时遍历嵌套字典
+    _VALIDATION_PLAN = tuple(
+        (section, tuple(rules.items())) for section, rules in VALIDATION_RULES.items()
+    )
+    
     def __init__(self, config_file: str = "config.json"):
         """
         初始化配置加载器
@@ -87,31 +122,33 @@ class ConfigLoader:
             json.JSONDecodeError: 配置文件格式错误
             ConfigValidationError: 配置验证失败
         """
-        if not self.config_file.exists():
-            # 创建默认配置文件
-            import copy
-            self._config = copy.deepcopy(self.DEFAULT_CONFIG)
-            self.save_config()
-            return self._config
-        
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
-            
-            # 合并默认配置和加载的配置
-            self._config = self._merge_with_defaults(loaded_config)
-            
-            # 验证配置
-            self._validate_config(self._config)
-            
-            # 如果配置有更新，保存回文件
-            if self._config != loaded_config:
-                self.save_config()
-            
+            if orjson is not None:
+                # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类
+                with open(self.config_file, 'rb') as f:
+                    loaded_config = orjson.loads(f.read())
+            else:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    loaded_config = json.load(f)
+        except FileNotFoundError:
+            # 文件不存在时创建默认配置文件（直接尝试打开，省去一次存在性检查）
+            self._config = _clone_defaults()
+            self.save_config()
             return self._config
-            
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"配置文件格式错误: {e}", e.doc, e.pos)
+        
+        # 合并默认配置和加载的配置
+        self._config = self._merge_with_defaults(loaded_config)
+        
+        # 验证配置
+        self._validate_config(self._config)
+        
+        # 如果配置有更新，保存回文件
+        if self._config != loaded_config:
+            self.save_config()
+        
+        return self._config
     
     def save_config(self) -> None:
         """
@@ -121,12 +158,13 @@ class ConfigLoader:
             IOError: 文件写入失败
         """
         if self._config is None:
-            self._config = self.DEFAULT_CONFIG.copy()
+            self._config = _clone_defaults()
         
         try:
             # 确保目录存在
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
+            # 保存始终使用标准库json，保持4空格缩进的文件格式
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, ensure_ascii=False, indent=4)
         except IOError as e:
@@ -142,8 +180,7 @@ class ConfigLoader:
         Returns:
             合并后的配置
         """
-        import copy
-        merged_config = copy.deepcopy(self.DEFAULT_CONFIG)
+        merged_config = _clone_defaults()
         
         for section, section_config in loaded_config.items():
             if section in merged_config:
@@ -166,7 +203,7 @@ class ConfigLoader:
         Raises:
             ConfigValidationError: 配置验证失败
         """
-        for section_name, section_rules in self.VALIDATION_RULES.items():
+        for section_name, section_rules in self._VALIDATION_PLAN:
             if section_name not in config:
                 continue
             
@@ -174,19 +211,14 @@ class ConfigLoader:
             if not isinstance(section_config, dict):
                 raise ConfigValidationError(f"配置节 '{section_name}' 必须是字典类型")
             
-            for key, expected_type in section_rules.items():
+            for key, expected_type in section_rules:
                 if key in section_config:
                     value = section_config[key]
-                    if isinstance(expected_type, tuple):
-                        if not isinstance(value, expected_type):
-                            raise ConfigValidationError(
-                                f"配置项 '{section_name}.{key}' 类型错误，期望 {expected_type}，实际 {type(value)}"
-                            )
-                    else:
-                        if not isinstance(value, expected_type):
-                            raise ConfigValidationError(
-                                f"配置项 '{section_name}.{key}' 类型错误，期望 {expected_type}，实际 {type(value)}"
-                            )
+                    # isinstance 同时接受单个类型和类型元组
+                    if not isinstance(value, expected_type):
+                        raise ConfigValidationError(
+                            f"配置项 '{section_name}.{key}' 类型错误，期望 {expected_type}，实际 {type(value)}"
+                        )
         
         # 特殊验证规则
         self._validate_special_rules(config)
@@ -209,10 +241,9 @@ class ConfigLoader:
         
         # 验证日志级别
         if "logging_config" in config:
-            valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
             level = config["logging_config"].get("level", "INFO")
-            if level not in valid_levels:
-                raise ConfigValidationError(f"日志级别必须是 {valid_levels} 中的一个")
+            if level not in _VALID_LOG_LEVELS:
+                raise ConfigValidationError(f"日志级别必须是 {list(_VALID_LOG_LEVELS)} 中的一个")
         
         # 验证窗口大小格式
         if "app_config" in config:
@@ -230,14 +261,8 @@ class ConfigLoader:
         Returns:
             是否有效
         """
-        try:
-            parts = size_str.split('x')
-            if len(parts) != 2:
-                return False
-            width, height = int(parts[0]), int(parts[1])
-            return width > 0 and height > 0
-        except (ValueError, IndexError):
-            return False
+        match = _WIN_SIZE_RE.fullmatch(size_str)
+        return match is not None and int(match[1]) > 0 and int(match[2]) > 0
     
     def get_app_config(self) -> Dict[str, Any]:
         """获取应用程序配置"""
@@ -321,8 +346,7 @@ class ConfigLoader:
     
     def reset_to_defaults(self) -> None:
         """重置配置为默认值"""
-        import copy
-        self._config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self._config = _clone_defaults()
     
     def get_config_info(self) -> Dict[str, Any]:
         """
@@ -2,6 +2,7 @@
 日志配置模块
 负责配置和管理应用程序日志
 """
+import functools
 import logging
 import logging.handlers
 import os
@@ -12,6 +13,51 @@ from typing import Dict, Any, Optional, Union
 from .config_loader import ConfigLoader
 
 
+# 文件大小单位及对应字节数，不带单位时为字节数
+_SIZE_UNITS = {'KB': 1024, 'MB': 1024 * 1024, 'GB': 1024 * 1024 * 1024}
+
+
+@functools.lru_cache(maxsize=32, typed=True)
+def _parse_size(size_str: Union[str, int]) -> int:
+    """
+    解析文件大小字符串（结果按输入缓存，配置中的大小通常只有少数几种写法）
+    
+    数字部分按 float()/int() 解析，带单位时可为小数，不带单位时必须是整数字节数
+    
+    Args:
+        size_str: 大小字符串，如 "10MB"
+        
+    Returns:
+        字节数
+        
+    Raises:
+        ValueError: 无效的大小格式
+    """
+    text = str(size_str).upper().strip()
+    multiplier = _SIZE_UNITS.get(text[-2:])
+    try:
+        if multiplier is not None:
+            return int(float(text[:-2]) * multiplier)
+        return int(text)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"无效的文件大小格式: {text}") from e
+
+
+@functools.lru_cache(maxsize=16)
+def _get_formatter(fmt: str, datefmt: Optional[str] = None) -> logging.Formatter:
+    """
+    获取日志格式化器（按格式字符串缓存，格式化器无状态，可在日志器间共享）
+    
+    Args:
+        fmt: 日志格式字符串
+        datefmt: 时间格式字符串
+        
+    Returns:
+        日志格式化器
+    """
+    return logging.Formatter(fmt, datefmt=datefmt)
+
+
 class LoggerError(Exception):
     """日志系统相关异常"""
     pass
@@ -20,7 +66,9 @@ class LoggerError(Exception):
 class ApplicationLogger:
     """应用程序日志管理器"""
     
-    _instances = {}  # 单例模式存储不同名称的日志器
+    # 单例模式存储不同名称的日志器，键为 (进程ID, 名称)；
+    # fork 出的子进程（如多进程测试）不会复用父进程创建的实例及其文件句柄
+    _instances = {}
     
     def __init__(self, name: str = "excel_position_query", config: Optional[Dict[str, Any]] = None):
         """
@@ -47,9 +95,24 @@ class ApplicationLogger:
         Returns:
             日志管理器实例
         """
-        if name not in cls._instances:
-            cls._instances[name] = cls(name, config)
-        return cls._instances[name]
+        key = (os.getpid(), name)
+        if key not in cls._instances:
+            cls._instances[key] = cls(name, config)
+        return cls._instances[key]
+    
+    @classmethod
+    def _reset_all(cls) -> None:
+        """关闭所有单例日志器的处理器并清除单例实例（主要供测试清理使用）"""
+        for instance in cls._instances.values():
+            if instance.logger:
+                instance._close_handlers()
+        cls._instances.clear()
+    
+    def _close_handlers(self) -> None:
+        """关闭并移除全部处理器"""
+        for handler in tuple(self.logger.handlers):
+            handler.close()
+        self.logger.handlers.clear()
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -86,15 +149,12 @@ class ApplicationLogger:
                 self.logger.setLevel(logging.INFO)
                 self.logger.warning(f"无效的日志级别 '{level}'，使用默认级别 INFO")
             
-            # 清除现有处理器（避免重复）
-            self.logger.handlers.clear()
+            # 关闭并清除现有处理器（避免重复，重新加载时不残留打开的日志文件）
+            self._close_handlers()
             
             # 创建格式化器
             log_format = self.config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            formatter = logging.Formatter(
-                log_format,
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+            formatter = _get_formatter(log_format, '%Y-%m-%d %H:%M:%S')
             
             # 添加控制台处理器
             self._add_console_handler(formatter)
@@ -172,20 +232,7 @@ class ApplicationLogger:
         Raises:
             ValueError: 无效的大小格式
         """
-        try:
-            size_str = str(size_str).upper().strip()
-            
-            if size_str.endswith('KB'):
-                return int(float(size_str[:-2]) * 1024)
-            elif size_str.endswith('MB'):
-                return int(float(size_str[:-2]) * 1024 * 1024)
-            elif size_str.endswith('GB'):
-                return int(float(size_str[:-2]) * 1024 * 1024 * 1024)
-            else:
-                # 默认为字节
-                return int(size_str)
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"无效的文件大小格式: {size_str}") from e
+        return _parse_size(size_str)
     
     def debug(self, message: str, *args, **kwargs) -> None:
         """记录调试信息"""